@@ -0,0 +1,54 @@
+# In benchmarks/fakes.py
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# Local stand-ins for GitHub. They mirror only the attributes our tools touch,
+# so benchmarks measure our own code rather than network latency. The fake
+# LLM is shared with the offline batch replay, so it lives in
+# src.integrations.fake_llm.
+
+
+@dataclass
+class FakeComment:
+    html_url: str
+
+
+@dataclass
+class FakeIssue:
+    number: int
+    comments: List[str] = field(default_factory=list)
+
+    def create_comment(self, body: str) -> FakeComment:
+        self.comments.append(body)
+        return FakeComment(
+            html_url=f"https://github.com/fake/repo/issues/{self.number}"
+            f"#comment-{len(self.comments)}"
+        )
+
+
+@dataclass
+class FakePullRequest:
+    number: int
+    diff: str
+
+    def get_diff(self) -> str:
+        return self.diff
+
+
+class FakeGithubRepo:
+    """
+    Behaves like the PyGithub Repository object returned by get_github_repo.
+
+    Every pull request shares the same diff, which is supplied up front.
+    """
+
+    def __init__(self, diff: str) -> None:
+        self.diff = diff
+        self.issues: Dict[int, FakeIssue] = {}
+
+    def get_pull(self, number: int) -> FakePullRequest:
+        return FakePullRequest(number=number, diff=self.diff)
+
+    def get_issue(self, number: int) -> FakeIssue:
+        return self.issues.setdefault(number, FakeIssue(number=number))
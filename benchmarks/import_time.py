@@ -0,0 +1,114 @@
+# In benchmarks/import_time.py
+#
+# Reports how long it takes to import a module in a fresh interpreter, using
+# Python's built-in `-X importtime` tracing.
+#
+# Usage:
+#   python -m benchmarks.import_time
+#   python -m benchmarks.import_time --module src.api.server --budget-ms 500
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List
+
+# Libraries that must never be imported while the server is starting up.
+HEAVY_MODULES = ("langchain", "langchain_anthropic", "langgraph", "github", "rope")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    Parses the output of `python -X importtime`.
+
+    Each line looks like "import time:  self [us] | cumulative | package",
+    where the package name is indented by two spaces per nesting level.
+
+    Returns:
+        A list of import records, in the order they were reported.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # Skips the header line.
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def measure_import(module: str) -> List[ImportRecord]:
+    """Imports `module` in a fresh interpreter and returns its import records."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{process.stderr}")
+    return parse_importtime(process.stderr)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report startup import times.")
+    parser.add_argument("--module", default="src.api.server")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Fail if the total import time exceeds this many milliseconds.",
+    )
+    args = parser.parse_args(argv)
+
+    records = measure_import(args.module)
+    total_us = sum(r.cumulative_us for r in records if r.depth == 0)
+
+    print(f"--- Import-time report for '{args.module}' ---")
+    print(f"{'cumulative (ms)':>16}{'self (ms)':>12}  module")
+    slowest = sorted(records, key=lambda r: r.cumulative_us, reverse=True)
+    for record in slowest[: args.top]:
+        print(
+            f"{record.cumulative_us / 1000:>16.1f}{record.self_us / 1000:>12.1f}"
+            f"  {record.module}"
+        )
+    print(f"\nTotal import time (incl. interpreter startup): {total_us / 1000:.1f} ms")
+
+    status = 0
+    heavy = sorted(
+        {r.module for r in records if r.module.split(".")[0] in HEAVY_MODULES}
+    )
+    if heavy:
+        print(f"Heavy modules imported at startup: {', '.join(heavy)}")
+        status = 1
+
+    if args.budget_ms is not None:
+        if total_us / 1000 > args.budget_ms:
+            print(f"Startup budget of {args.budget_ms:.0f} ms exceeded.")
+            status = 1
+        else:
+            print(f"Within the startup budget of {args.budget_ms:.0f} ms.")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
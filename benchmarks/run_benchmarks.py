@@ -0,0 +1,360 @@
+# In benchmarks/run_benchmarks.py
+#
+# Reproducible performance benchmarks for the Aegis Code tools.
+#
+# Usage:
+#   python -m benchmarks.run_benchmarks --size medium --output results.json
+#   python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+#   python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+from unittest import mock
+
+from benchmarks.fakes import FakeGithubRepo
+from benchmarks.synthetic_repo import (
+    SIZES,
+    RepoSize,
+    generate_diff,
+    generate_repository,
+)
+
+
+@dataclass
+class Workspace:
+    """Everything a benchmark case needs: the synthetic repo and its diff."""
+
+    root: str
+    size: RepoSize
+    paths: List[str]
+    sources: Dict[str, str]
+    diff: str
+
+
+# A case receives the workspace and returns the function to time, together
+# with the number of operations that one call of that function performs.
+BenchmarkCase = Callable[[Workspace], Tuple[Callable[[], Any], int]]
+
+
+# --- BENCHMARK CASES ---
+
+
+def bench_analyze_code_structure(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.agents.code_analysis_agent import analyze_code_structure
+
+    sources = list(ws.sources.values())
+
+    def run() -> None:
+        for source in sources:
+            analyze_code_structure(source)
+
+    return run, len(sources)
+
+
+def bench_analyze_code_outline(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.agents.code_analysis_agent import analyze_code_structure
+
+    sources = list(ws.sources.values())
+
+    def run() -> None:
+        for source in sources:
+            analyze_code_structure(source, mode="outline")
+
+    return run, len(sources)
+
+
+def bench_parse_diff(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.integrations.diff_parser import parse_diff
+
+    def run() -> None:
+        parse_diff(ws.diff)
+
+    return run, len(ws.paths)
+
+
+def bench_read_file_batch(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.agents.refactoring_agent import read_file
+
+    full_paths = [os.path.join(ws.root, p) for p in ws.paths]
+
+    def run() -> None:
+        for path in full_paths:
+            read_file(path)
+
+    return run, len(full_paths)
+
+
+def bench_write_file_batch(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.agents.refactoring_agent import write_file
+
+    out_dir = os.path.join(ws.root, "written")
+    items = [
+        (os.path.join(out_dir, os.path.basename(p)), ws.sources[p]) for p in ws.paths
+    ]
+
+    def run() -> None:
+        for path, content in items:
+            write_file(path, content)
+
+    return run, len(items)
+
+
+def bench_run_pytest(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    from src.agents.testing_agent import run_pytest
+
+    target = os.path.join(ws.root, "tests")
+
+    def run() -> None:
+        run_pytest(target)
+
+    return run, 1
+
+
+def bench_api_throughput(ws: Workspace) -> Tuple[Callable[[], Any], int]:
+    # These imports fail without the API extras; the runner records a skip.
+    from fastapi.testclient import TestClient
+
+    from src.agents import registry
+    from src.agents.code_review_agent import CodeReviewAgent
+    from src.api.server import app
+    from src.integrations.fake_llm import FakeLLM
+
+    requests_per_endpoint = 50
+    client = TestClient(app)
+    fake_repo = FakeGithubRepo(ws.diff)
+    # Jobs go to a throwaway store, never to the real ./.aegis_cache, the
+    # review fetches its diff through the fake GitHub repository, and the
+    # shared review agent answers through the fake LLM.
+    env = {"AEGIS_CACHE_PATH": os.path.join(ws.root, "shared.sqlite3")}
+    review_agent = CodeReviewAgent(
+        llm=FakeLLM(), system_prompt=registry.get_system_prompt("code_review")
+    )
+    agents = {"code_review": review_agent}
+
+    def run() -> None:
+        with mock.patch.dict(os.environ, env), mock.patch.dict(
+            registry._agents, agents
+        ), mock.patch(
+            "src.integrations.github_tools.get_github_repo", return_value=fake_repo
+        ):
+            for _ in range(requests_per_endpoint):
+                client.get("/health")
+                client.post("/review-pr", json={"pr_number": 1})
+                client.post("/modernize-codebase")
+
+    return run, requests_per_endpoint * 3
+
+
+CASES: Dict[str, BenchmarkCase] = {
+    "analyze_code_structure": bench_analyze_code_structure,
+    "analyze_code_outline": bench_analyze_code_outline,
+    "parse_diff": bench_parse_diff,
+    "read_file_batch": bench_read_file_batch,
+    "write_file_batch": bench_write_file_batch,
+    "run_pytest": bench_run_pytest,
+    "api_throughput": bench_api_throughput,
+}
+
+# Spawning pytest is orders of magnitude slower than the in-process cases,
+# so it is repeated fewer times to keep the whole suite quick.
+REPEAT_OVERRIDES = {"run_pytest": 3}
+
+
+# --- RUNNER ---
+
+
+def build_workspace(root: str, size: RepoSize, seed: int) -> Workspace:
+    """Generates the synthetic repository and diff used by every case."""
+    paths = generate_repository(root, size, seed=seed)
+    sources = {}
+    for path in paths:
+        with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+            sources[path] = f.read()
+    diff = generate_diff(sources, size.hunks_per_file, seed=seed)
+    return Workspace(root=root, size=size, paths=paths, sources=sources, diff=diff)
+
+
+def time_case(func: Callable[[], Any], ops: int, repeats: int) -> Dict[str, Any]:
+    """
+    Calls func `repeats` times (after one warm-up call) and summarizes timings.
+
+    Returns:
+        A dictionary with min/median/mean wall-clock seconds and throughput.
+    """
+    func()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    return {
+        "repeats": repeats,
+        "ops": ops,
+        "min": min(timings),
+        "median": median,
+        "mean": statistics.fmean(timings),
+        "ops_per_second": ops / median if median > 0 else None,
+    }
+
+
+def run_benchmarks(
+    size_name: str = "small",
+    repeats: int = 5,
+    seed: int = 0,
+    only: List[str] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmark cases against a fresh synthetic repository.
+
+    Args:
+        size_name: One of the keys of SIZES.
+        repeats: How many timed calls each case gets.
+        seed: Seed for the synthetic repository and diff.
+        only: Optional list of case names to run instead of all of them.
+
+    Returns:
+        A JSON-serializable dictionary with run metadata and per-case results.
+    """
+    size = SIZES[size_name]
+    results: Dict[str, Any] = {}
+    # The agents print progress for every call, so their output is discarded
+    # to keep it out of both the report and the timings.
+    with tempfile.TemporaryDirectory(prefix="aegis-bench-") as root, open(
+        os.devnull, "w"
+    ) as devnull, contextlib.redirect_stdout(devnull):
+        ws = build_workspace(root, size, seed)
+        for name, case in CASES.items():
+            if only and name not in only:
+                continue
+            try:
+                func, ops = case(ws)
+            except ImportError as e:
+                results[name] = {"skipped": f"missing dependency: {e}"}
+                continue
+            results[name] = time_case(
+                func, ops, min(repeats, REPEAT_OVERRIDES.get(name, repeats))
+            )
+
+    return {
+        "metadata": {
+            "size": size_name,
+            "seed": seed,
+            "repeats": repeats,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Compares the median timings of two runs.
+
+    A case regresses when its median is more than `threshold` (a fraction,
+    e.g. 0.2 for 20%) slower than the baseline. Cases that were skipped or
+    are missing from either run are ignored.
+
+    Returns:
+        A list of human-readable regression messages; empty if none.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "median" not in base or "median" not in result:
+            continue
+        limit = base["median"] * (1 + threshold)
+        if result["median"] > limit:
+            slowdown = (result["median"] / base["median"] - 1) * 100
+            regressions.append(
+                f"{name}: median {result['median']:.6f}s vs baseline "
+                f"{base['median']:.6f}s (+{slowdown:.1f}%, threshold "
+                f"{threshold * 100:.0f}%)"
+            )
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Renders the results as a small fixed-width table."""
+    lines = [
+        f"--- Aegis Code Benchmarks (size={report['metadata']['size']}) ---",
+        f"{'case':<26}{'median (s)':>14}{'min (s)':>14}{'ops/s':>14}",
+    ]
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            lines.append(f"{name:<26}skipped ({result['skipped']})")
+            continue
+        ops_per_second = result["ops_per_second"] or 0.0
+        lines.append(
+            f"{name:<26}{result['median']:>14.6f}{result['min']:>14.6f}"
+            f"{ops_per_second:>14.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Aegis Code benchmarks.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only", nargs="*", choices=sorted(CASES), help="Run only these cases."
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="Where to write results."
+    )
+    parser.add_argument("--baseline", help="Baseline JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown before a case counts as a regression (0.2 = 20%%).",
+    )
+    parser.add_argument(
+        "--save-baseline", help="Also write the results to this baseline path."
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.size, args.repeats, args.seed, args.only)
+    print(format_report(report))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to '{args.output}'.")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to '{args.save_baseline}'.")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("metadata", {}).get("size") != args.size:
+            print("Warning: baseline was recorded with a different --size.")
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print("\n--- Performance regressions ---")
+            for message in regressions:
+                print(message)
+            return 1
+        print("\nNo regressions against the baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+# In benchmarks/synthetic_repo.py
+
+import os
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+# --- SIZE PRESETS ---
+# Each preset controls how much synthetic code the benchmark suite generates.
+# The same seed always produces the same repository, so runs are comparable.
+
+
+@dataclass(frozen=True)
+class RepoSize:
+    """Describes the shape of a synthetic repository."""
+
+    files: int
+    classes_per_file: int
+    methods_per_class: int
+    functions_per_file: int
+    hunks_per_file: int
+
+
+SIZES: Dict[str, RepoSize] = {
+    "small": RepoSize(
+        files=10,
+        classes_per_file=2,
+        methods_per_class=3,
+        functions_per_file=3,
+        hunks_per_file=2,
+    ),
+    "medium": RepoSize(
+        files=50,
+        classes_per_file=5,
+        methods_per_class=5,
+        functions_per_file=10,
+        hunks_per_file=4,
+    ),
+    "large": RepoSize(
+        files=200,
+        classes_per_file=10,
+        methods_per_class=8,
+        functions_per_file=25,
+        hunks_per_file=8,
+    ),
+}
+
+IMPORT_POOL = ["os", "sys", "json", "re", "math", "itertools", "functools"]
+FROM_IMPORT_POOL = [
+    ("typing", "Any"),
+    ("typing", "Dict"),
+    ("typing", "List"),
+    ("collections", "defaultdict"),
+    ("dataclasses", "dataclass"),
+    ("pathlib", "Path"),
+]
+
+
+def generate_module(
+    rng: random.Random, classes: int, methods_per_class: int, functions: int
+) -> str:
+    """
+    Generates the source of a single, syntactically valid Python module.
+
+    Args:
+        rng: The random generator used to vary names and bodies.
+        classes: Number of classes to emit.
+        methods_per_class: Number of methods emitted inside each class.
+        functions: Number of top-level functions to emit.
+
+    Returns:
+        A string containing the module source.
+    """
+    lines: List[str] = []
+    for module in rng.sample(IMPORT_POOL, 3):
+        lines.append(f"import {module}")
+    for module, name in rng.sample(FROM_IMPORT_POOL, 2):
+        lines.append(f"from {module} import {name}")
+    lines.append("")
+
+    for c in range(classes):
+        lines.append("")
+        lines.append(f"class Synthetic{c}:")
+        lines.append(f'    """Synthetic class number {c}."""')
+        lines.append("")
+        lines.append("    def __init__(self, value):")
+        lines.append("        self.value = value")
+        for m in range(methods_per_class):
+            arg_count = rng.randint(0, 3)
+            args = ", ".join(["self"] + [f"arg{i}" for i in range(arg_count)])
+            lines.append("")
+            lines.append(f"    def method_{m}({args}):")
+            lines.append(f'        """Returns a value derived from method {m}."""')
+            lines.append(f"        total = self.value + {rng.randint(1, 100)}")
+            lines.append("        for i in range(3):")
+            lines.append("            total += i")
+            lines.append("        return total")
+
+    for f in range(functions):
+        arg_count = rng.randint(0, 4)
+        args = ", ".join(f"arg{i}" for i in range(arg_count))
+        lines.append("")
+        lines.append("")
+        lines.append(f"def function_{f}({args}):")
+        lines.append(f'    """Synthetic function number {f}."""')
+        lines.append(f"    result = [x * {rng.randint(1, 9)} for x in range(10)]")
+        lines.append("    return sum(result)")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_repository(root: str, size: RepoSize, seed: int = 0) -> List[str]:
+    """
+    Writes a synthetic Python package (plus a passing test file) under root.
+
+    Args:
+        root: Directory in which the repository is created.
+        size: The shape of the repository to generate.
+        seed: Seed for the random generator, for reproducible output.
+
+    Returns:
+        A list of the generated module paths, relative to root.
+    """
+    rng = random.Random(seed)
+    package_dir = os.path.join(root, "synthetic_pkg")
+    os.makedirs(package_dir, exist_ok=True)
+    open(os.path.join(package_dir, "__init__.py"), "w").close()
+
+    paths = []
+    for i in range(size.files):
+        relative_path = os.path.join("synthetic_pkg", f"module_{i}.py")
+        source = generate_module(
+            rng, size.classes_per_file, size.methods_per_class, size.functions_per_file
+        )
+        with open(os.path.join(root, relative_path), "w", encoding="utf-8") as f:
+            f.write(source)
+        paths.append(relative_path)
+
+    tests_dir = os.path.join(root, "tests")
+    os.makedirs(tests_dir, exist_ok=True)
+    with open(os.path.join(tests_dir, "test_synthetic.py"), "w") as f:
+        f.write("def test_synthetic():\n    assert sum(range(4)) == 6\n")
+
+    return paths
+
+
+def generate_diff(files: Dict[str, str], hunks_per_file: int, seed: int = 0) -> str:
+    """
+    Generates a unified diff that modifies the given files.
+
+    Each hunk replaces one line with two new ones, so the diff looks like a
+    typical small pull request spread across many files.
+
+    Args:
+        files: A mapping of relative file paths to their current content.
+        hunks_per_file: Number of hunks generated per file.
+        seed: Seed for the random generator, for reproducible output.
+
+    Returns:
+        A string containing the unified diff.
+    """
+    rng = random.Random(seed)
+    out: List[str] = []
+    for path, content in files.items():
+        source_lines = content.splitlines()
+        if not source_lines:
+            continue
+        out.append(f"diff --git a/{path} b/{path}")
+        out.append(f"--- a/{path}")
+        out.append(f"+++ b/{path}")
+
+        step = max(len(source_lines) // max(hunks_per_file, 1), 1)
+        offset = 0
+        for start in range(0, len(source_lines), step)[:hunks_per_file]:
+            target = min(start + rng.randint(0, step - 1), len(source_lines) - 1)
+            old_start = target + 1
+            new_start = old_start + offset
+            out.append(f"@@ -{old_start},1 +{new_start},2 @@")
+            out.append(f"-{source_lines[target]}")
+            out.append(f"+{source_lines[target]}  # changed")
+            out.append(f"+# synthetic change {rng.randint(0, 10_000)}")
+            offset += 1
+    return "\n".join(out) + "\n"
@@ -2,7 +2,14 @@
 
 import ast
 import json
-from typing import Any, Dict, List, Set
+import tokenize
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Sources larger than this many characters are outlined from the token stream
+# instead of parsed into a full AST, when analyze_code_structure runs in
+# "auto" mode. Multi-megabyte generated files (protobuf stubs, vendored
+# bundles) would otherwise need hundreds of megabytes for their syntax tree.
+OUTLINE_SIZE_THRESHOLD = 1_000_000
 
 
 class CodeVisitor(ast.NodeVisitor):
@@ -78,21 +85,265 @@ class CodeVisitor(ast.NodeVisitor):
         }
 
 
-def analyze_code_structure(code: str) -> str:
+def _iter_lines(code: str) -> Iterator[str]:
+    """Yields the lines of code one by one, without splitting it all up front."""
+    start, length = 0, len(code)
+    while start < length:
+        end = code.find("\n", start)
+        end = length if end == -1 else end + 1
+        yield code[start:end]
+        start = end
+
+
+class CodeOutliner:
+    """
+    Builds a lightweight outline of Python code from its token stream.
+
+    Unlike CodeVisitor, this never materializes the syntax tree: tokens are
+    consumed one at a time and only top-level imports, classes (with their
+    methods) and functions are recorded. Docstrings are reported as line
+    spans rather than text. Memory use therefore stays close to the size of
+    the source itself, and deeply nested expressions cannot hit the parser's
+    recursion limit. The trade-off is precision: the source is not fully
+    validated, and nothing below the top level (or class body) is reported.
+    """
+
+    def __init__(self) -> None:
+        self.structure: Dict[str, Any] = {
+            "mode": "outline",
+            "imports": [],
+            "classes": [],
+            "functions": [],
+        }
+
+    def outline(self, code: str) -> Dict[str, Any]:
+        """Walks the token stream of code and returns the collected outline."""
+        self._tokens = tokenize.generate_tokens(_iter_lines(code).__next__)
+        depth = 0
+        # (indentation depth of the class body, class info) for open classes.
+        class_stack: List[Tuple[int, Dict[str, Any]]] = []
+        awaiting_docstring: Optional[Dict[str, Any]] = None
+        at_statement_start = True
+
+        for tok in self._tokens:
+            if tok.type == tokenize.INDENT:
+                depth += 1
+                continue
+            if tok.type == tokenize.DEDENT:
+                depth -= 1
+                continue
+            if tok.type == tokenize.NEWLINE or (
+                tok.type == tokenize.OP and tok.string == ";"
+            ):
+                at_statement_start = True
+                continue
+            if tok.type in (tokenize.NL, tokenize.COMMENT, tokenize.ENCODING):
+                continue
+
+            if awaiting_docstring is not None:
+                # The first statement of a body is its docstring if it is a string.
+                if tok.type == tokenize.STRING:
+                    awaiting_docstring["docstring_span"] = [tok.start[0], tok.end[0]]
+                awaiting_docstring = None
+
+            if not at_statement_start:
+                continue
+            at_statement_start = False
+            if tok.type != tokenize.NAME:
+                continue
+
+            while class_stack and depth < class_stack[-1][0]:
+                class_stack.pop()
+            in_class_body = bool(class_stack) and depth == class_stack[-1][0]
+            word = tok.string
+
+            if depth == 0 and word in ("import", "from"):
+                self._read_import(word)
+                at_statement_start = True
+            elif depth == 0 and word == "class":
+                class_info = self._read_class()
+                self.structure["classes"].append(class_info)
+                class_stack.append((depth + 1, class_info))
+                awaiting_docstring = class_info
+            elif (depth == 0 or in_class_body) and word in ("def", "async"):
+                function_info = self._read_def(is_async=word == "async")
+                if function_info is None:
+                    continue
+                if in_class_body:
+                    class_stack[-1][1]["methods"].append(function_info)
+                else:
+                    self.structure["functions"].append(function_info)
+                awaiting_docstring = function_info
+
+        return self.structure
+
+    def _read_import(self, keyword: str) -> None:
+        """Consumes an import statement, through its NEWLINE or semicolon."""
+        module = ""
+        if keyword == "from":
+            parts = []
+            for tok in self._tokens:
+                if tok.type == tokenize.NAME and tok.string == "import":
+                    break
+                if tok.type == tokenize.NAME:
+                    parts.append(tok.string)
+            # Matches CodeVisitor, which ignores the level of relative imports.
+            module = ".".join(parts) + "."
+
+        name: List[str] = []
+        alias = None
+        expecting_alias = False
+        for tok in self._tokens:
+            end = tok.type in (tokenize.NEWLINE, tokenize.ENDMARKER) or (
+                tok.type == tokenize.OP and tok.string == ";"
+            )
+            if end or tok.string == ",":
+                if name:
+                    self.structure["imports"].append(
+                        {"module": module + ".".join(name), "as": alias}
+                    )
+                name, alias = [], None
+                if end:
+                    return
+            elif tok.type == tokenize.NAME and tok.string == "as":
+                expecting_alias = True
+            elif tok.type == tokenize.NAME or tok.string == "*":
+                if expecting_alias:
+                    alias, expecting_alias = tok.string, False
+                else:
+                    name.append(tok.string)
+
+    def _read_header(self) -> List[List[tokenize.TokenInfo]]:
+        """
+        Consumes a def or class header up to its colon.
+
+        Returns:
+            The tokens of each comma-separated item of the first parenthesized
+            list in the header (the parameters or bases). Default values are
+            dropped, so an item ends at its "=".
+        """
+        items: List[List[tokenize.TokenInfo]] = []
+        current: List[tokenize.TokenInfo] = []
+        depth = 0
+        seen_list = False
+        in_default = False
+        # Lambdas in a default whose ":" has not been seen yet; until it is,
+        # a comma separates lambda parameters, not items.
+        open_lambdas = 0
+        for tok in self._tokens:
+            if tok.type == tokenize.OP and tok.string in "([{":
+                depth += 1
+                if depth == 1 and tok.string == "(" and not seen_list:
+                    continue
+            elif tok.type == tokenize.OP and tok.string in ")]}":
+                depth -= 1
+                if depth == 0 and not seen_list:
+                    seen_list = True
+                    if current:
+                        items.append(current)
+                    continue
+            elif tok.type == tokenize.OP and tok.string == ":" and depth == 0:
+                return items
+            elif tok.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                return items
+
+            if depth == 1 and not seen_list:
+                if tok.type == tokenize.OP and tok.string == "," and not open_lambdas:
+                    items.append(current)
+                    current = []
+                    in_default = False
+                elif in_default:
+                    if tok.type == tokenize.NAME and tok.string == "lambda":
+                        open_lambdas += 1
+                    elif tok.type == tokenize.OP and tok.string == ":" and open_lambdas:
+                        open_lambdas -= 1
+                elif tok.type == tokenize.OP and tok.string == "=":
+                    current.append(tok)
+                    in_default = True
+                elif tok.type not in (tokenize.NL, tokenize.COMMENT):
+                    current.append(tok)
+        return items
+
+    def _read_class(self) -> Dict[str, Any]:
+        name = next(self._tokens).string
+        # Like CodeVisitor, only plain names count as bases (no keywords,
+        # attributes or calls).
+        bases = [
+            item[0].string
+            for item in self._read_header()
+            if len(item) == 1 and item[0].type == tokenize.NAME
+        ]
+        return {"name": name, "methods": [], "bases": bases, "docstring_span": None}
+
+    def _read_def(self, is_async: bool) -> Optional[Dict[str, Any]]:
+        if is_async:
+            tok = next(self._tokens)
+            if tok.string != "def":
+                # "async for" or "async with"; not a definition.
+                return None
+        name = next(self._tokens).string
+        args: List[str] = []
+        for item in self._read_header():
+            if not item:
+                continue
+            first = item[0]
+            if first.type == tokenize.OP and first.string == "/":
+                # Positional-only parameters; CodeVisitor does not list them.
+                args = []
+            elif first.type == tokenize.OP and first.string in ("*", "**"):
+                # Everything after * or **name is keyword-only or variadic.
+                break
+            elif first.type == tokenize.NAME:
+                args.append(first.string)
+        return {"name": name, "args": args, "docstring_span": None}
+
+
+def outline_code_structure(code: str) -> Dict[str, Any]:
+    """
+    Returns a token-based outline of code; see CodeOutliner.
+
+    Raises:
+        SyntaxError: If the code cannot be tokenized.
+    """
+    try:
+        return CodeOutliner().outline(code)
+    except tokenize.TokenError as e:
+        raise SyntaxError(e.args[0]) from e
+
+
+def analyze_code_structure(code: str, mode: str = "auto") -> str:
     """
     Analyzes a string of Python code and returns its structure as a JSON string.
 
     This function serves as the primary tool for the CodeAnalysisAgent. It uses
     the AST library to create a reliable, structured representation of the code.
 
+    For very large sources the full tree is too expensive, so in "auto" mode
+    code longer than OUTLINE_SIZE_THRESHOLD characters is outlined from its
+    token stream instead. The full analysis also falls back to the outline
+    when deeply nested code exhausts the parser's recursion or memory limits.
+    Outlines carry `"mode": "outline"` and docstring line spans, not text.
+
     Args:
         code: A string containing valid Python source code.
+        mode: "auto" (the default), "full" to always build the AST when
+            possible, or "outline" to always use the token stream.
+
+    Raises:
+        ValueError: If mode is not one of the above.
 
     Returns:
         A JSON string summarizing the code's structure. Returns an error
         message in JSON format if the code cannot be parsed.
     """
+    if mode not in ("auto", "full", "outline"):
+        raise ValueError(f"Unknown analysis mode: {mode!r}")
+    if mode == "auto":
+        mode = "outline" if len(code) > OUTLINE_SIZE_THRESHOLD else "full"
+
     try:
+        if mode == "outline":
+            return json.dumps(outline_code_structure(code), indent=2)
         tree = ast.parse(code)
         # Pre-process the tree to add parent pointers for accurate context.
         # This is crucial for distinguishing methods from top-level functions.
@@ -102,6 +353,9 @@ def analyze_code_structure(code: str) -> str:
         visitor = CodeVisitor()
         visitor.visit(tree)
         return json.dumps(visitor.structure, indent=2)
+    except (RecursionError, MemoryError):
+        # Too deeply nested for the AST; the token stream has no such limit.
+        return analyze_code_structure(code, mode="outline")
     except SyntaxError as e:
         return json.dumps(
             {"error": "Invalid Python syntax", "details": str(e)}, indent=2
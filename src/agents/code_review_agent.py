@@ -1,5 +1,9 @@
 # In src/agents/code_review_agent.py
 
+from typing import Optional
+
+from src.agents.prompts import PR_REVIEW_AGENT_PROMPT, build_system_prompt
+
 
 class CodeReviewAgent:
     """
@@ -13,12 +17,22 @@ class CodeReviewAgent:
     its review tasks.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, llm=None, system_prompt: Optional[str] = None) -> None:
         """
         Initializes the CodeReviewAgent.
 
         The initialize the LLM, prompt, and tools.
+
+        Args:
+            llm: An optional chat model with a LangChain-style `invoke`
+                method. Without one, the agent returns a dummy review.
+            system_prompt: The assembled system prompt, as cached by the agent
+                registry. Built from PR_REVIEW_AGENT_PROMPT when omitted.
         """
+        self.llm = llm
+        self.system_prompt = system_prompt or build_system_prompt(
+            PR_REVIEW_AGENT_PROMPT
+        )
 
         print("CodeReviewAgent initialized.")
 
@@ -34,6 +48,13 @@ class CodeReviewAgent:
             A string containing the generated code review.
         """
 
+        if self.llm is not None:
+            print("\n--- CodeReviewAgent: Reviewing the code diff ---\n")
+            response = self.llm.invoke(
+                [("system", self.system_prompt), ("human", code_diff)]
+            )
+            return response.content
+
         print("\n --- CodeReviewAgent: Pretending to review the code diff ---\n")
         print(code_diff)
 
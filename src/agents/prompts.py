@@ -55,3 +55,19 @@ Structure your feedback clearly, referencing the file and line number for each c
 Always be polite and constructive in your feedback. Your goal is to help the developer improve their code, not to criticize.
 Your final output should be a single, well-formatted review comment.
 """
+
+
+# --- PROMPT ASSEMBLY ---
+
+
+def build_system_prompt(agent_prompt: str) -> str:
+    """
+    Combines the shared constitution with an agent-specific prompt.
+
+    Args:
+        agent_prompt: One of the agent or workflow prompts defined above.
+
+    Returns:
+        The full system prompt sent to the LLM for that agent.
+    """
+    return f"{AGENT_CONSTITUTION.strip()}\n\n{agent_prompt.strip()}\n"
@@ -1,7 +1,15 @@
 # # In src/agents/refactoring_agent.py
 
+import json
 import os
-from typing import Dict, Callable
+import shutil
+import tempfile
+from typing import Any, Dict, Callable, List
+
+# The process umask can only be read by setting it, which is not thread-safe,
+# so it is read once at import. write_files applies it to new files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 # --- ATOMIC TOOLS ---
 
@@ -38,6 +46,124 @@ def write_file(file_path: str, content: str) -> str:
         return f"Error: An unexpected error occurred while writing to the file: {e}"
 
 
+def write_files(files: Dict[str, str]) -> str:
+    """
+    Writes several files in one batch, so either all of them change or none do.
+
+    Every file is first written to a temporary file next to its target, and
+    only once all of them are staged are they moved into place. Files being
+    replaced are backed up first and restored if any move fails; files and
+    directories the batch created are removed again.
+    """
+    staged = []
+    backups = {}
+    replaced = []
+    created_dirs = []
+    try:
+        for file_path, content in files.items():
+            directory = os.path.dirname(file_path) or "."
+            missing = directory
+            while missing and not os.path.exists(missing):
+                created_dirs.append(missing)
+                missing = os.path.dirname(missing)
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".aegis-tmp")
+            staged.append((tmp_path, file_path))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            if os.path.exists(file_path):
+                fd, backup_path = tempfile.mkstemp(dir=directory, suffix=".aegis-bak")
+                os.close(fd)
+                # copy2 keeps the original permissions for the restore.
+                shutil.copy2(file_path, backup_path)
+                backups[file_path] = backup_path
+        for tmp_path, file_path in staged:
+            if file_path in backups:
+                # Keeps the permissions of the file being replaced.
+                os.chmod(tmp_path, os.stat(backups[file_path]).st_mode)
+            else:
+                # mkstemp creates files as 0600; new files get the same mode
+                # open() would have given them.
+                os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, file_path)
+            replaced.append(file_path)
+        return f"Successfully wrote {len(files)} files."
+    except Exception as e:
+        for file_path in replaced:
+            if file_path in backups:
+                os.replace(backups.pop(file_path), file_path)
+            else:
+                os.remove(file_path)
+        for tmp_path, _ in staged:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        # Deepest first, so each directory is empty by the time it is removed.
+        for directory in sorted(set(created_dirs), key=len, reverse=True):
+            if os.path.isdir(directory) and not os.listdir(directory):
+                os.rmdir(directory)
+        return f"Error: An unexpected error occurred while writing the files: {e}"
+    finally:
+        for path in [tmp_path for tmp_path, _ in staged] + list(backups.values()):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# --- ROPE-BACKED TOOLS ---
+# rope is imported only when one of these tools is first used.
+
+
+def rope_refactor(repo_root: str, refactorings: List[Dict[str, Any]]) -> str:
+    """
+    Applies a batch of rope refactorings (rename, move, extract) across a project.
+
+    The rope project for repo_root is kept alive between calls, and all
+    files changed by the batch are written together at the end. See
+    RopeRefactorer.apply for the format of each refactoring.
+    """
+    try:
+        from src.agents.rope_refactoring import get_refactorer
+
+        result = get_refactorer(repo_root).apply(refactorings)
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        return f"Error: The refactoring could not be applied: {e}"
+
+
+def rope_rename(repo_root: str, path: str, symbol: str, new_name: str) -> str:
+    """Renames a symbol defined in `path` and updates every reference to it."""
+    return rope_refactor(
+        repo_root,
+        [{"op": "rename", "path": path, "symbol": symbol, "new_name": new_name}],
+    )
+
+
+def rope_move(repo_root: str, path: str, symbol: str, destination: str) -> str:
+    """Moves a global symbol defined in `path` to the `destination` module."""
+    return rope_refactor(
+        repo_root,
+        [{"op": "move", "path": path, "symbol": symbol, "destination": destination}],
+    )
+
+
+def rope_extract(
+    repo_root: str, path: str, start_line: int, end_line: int, new_name: str
+) -> str:
+    """Extracts lines start_line to end_line of `path` into a new method."""
+    return rope_refactor(
+        repo_root,
+        [
+            {
+                "op": "extract",
+                "path": path,
+                "start_line": start_line,
+                "end_line": end_line,
+                "new_name": new_name,
+            }
+        ],
+    )
+
+
 class RefactoringAgent:
     """
     An agent specialized in modifying code by reading and writing files.
@@ -48,6 +174,11 @@ class RefactoringAgent:
         self.tools: Dict[str, Callable[..., str]] = {
             "read_file": read_file,
             "write_file": write_file,
+            "write_files": write_files,
+            "rope_refactor": rope_refactor,
+            "rope_rename": rope_rename,
+            "rope_move": rope_move,
+            "rope_extract": rope_extract,
         }
 
     def run_dummy_test(self):
@@ -0,0 +1,112 @@
+# In src/agents/registry.py
+
+import importlib
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Agents are referenced by import path instead of being imported here, so that
+# starting the API server does not pay for the LLM and integration libraries
+# they pull in. Each entry maps an agent name to (module, class, prompt name);
+# agents with a prompt name receive the assembled prompt as `system_prompt`.
+AGENT_REGISTRY: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "code_analysis": (
+        "src.agents.code_analysis_agent",
+        "CodeAnalysisAgent",
+        None,
+    ),
+    "code_review": (
+        "src.agents.code_review_agent",
+        "CodeReviewAgent",
+        "PR_REVIEW_AGENT_PROMPT",
+    ),
+    "documentation": (
+        "src.agents.documentation_agent",
+        "DocumentationAgent",
+        None,
+    ),
+    "refactoring": (
+        "src.agents.refactoring_agent",
+        "RefactoringAgent",
+        None,
+    ),
+    "security": (
+        "src.agents.security_agent",
+        "SecurityAgent",
+        None,
+    ),
+    "testing": (
+        "src.agents.testing_agent",
+        "TestingAgent",
+        None,
+    ),
+}
+
+_agents: Dict[str, Any] = {}
+_system_prompts: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def get_agent(name: str) -> Any:
+    """
+    Returns the shared instance of an agent, importing and building it on first use.
+
+    Args:
+        name: A key of AGENT_REGISTRY.
+
+    Returns:
+        The agent instance. Later calls return the same object.
+    """
+    agent = _agents.get(name)
+    if agent is not None:
+        return agent
+
+    module_path, class_name, prompt_name = AGENT_REGISTRY[name]
+    with _lock:
+        if name not in _agents:
+            module = importlib.import_module(module_path)
+            kwargs = {}
+            if prompt_name is not None:
+                kwargs["system_prompt"] = get_system_prompt(name)
+            _agents[name] = getattr(module, class_name)(**kwargs)
+        return _agents[name]
+
+
+def get_system_prompt(name: str) -> Optional[str]:
+    """
+    Returns the assembled system prompt for an agent, building it on first use.
+
+    Args:
+        name: A key of AGENT_REGISTRY.
+
+    Returns:
+        The full system prompt, or None if the agent does not use one.
+    """
+    prompt_name = AGENT_REGISTRY[name][2]
+    if prompt_name is None:
+        return None
+    if name not in _system_prompts:
+        prompts = importlib.import_module("src.agents.prompts")
+        _system_prompts[name] = prompts.build_system_prompt(
+            getattr(prompts, prompt_name)
+        )
+    return _system_prompts[name]
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Builds every registered agent and its system prompt ahead of the first request.
+
+    The API server runs this in a background thread after startup, so the
+    health check is already answering while the heavy imports happen.
+
+    Returns:
+        A dictionary mapping each agent name to its warm-up time in seconds.
+    """
+    timings = {}
+    for name in AGENT_REGISTRY:
+        start = time.perf_counter()
+        get_agent(name)
+        get_system_prompt(name)
+        timings[name] = time.perf_counter() - start
+    return timings
@@ -0,0 +1,216 @@
+# In src/agents/rope_refactoring.py
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from rope.base.fscommands import FileSystemCommands
+from rope.base.project import Project
+from rope.refactor.extract import ExtractMethod, ExtractVariable
+from rope.refactor.move import create_move
+from rope.refactor.rename import Rename
+
+
+class BufferedFileSystemCommands(FileSystemCommands):
+    """
+    Rope file system commands that keep file writes in memory.
+
+    Rope reads every file through these commands, so later refactorings in a
+    batch see the output of earlier ones without anything touching the disk.
+    Structural operations (creating, moving, removing files) still happen on
+    disk immediately, because rope checks for them there, and any buffered
+    content follows the file it belongs to.
+    """
+
+    def __init__(self) -> None:
+        self.pending: Dict[str, bytes] = {}
+
+    def read(self, path):
+        if path in self.pending:
+            return self.pending[path]
+        return super().read(path)
+
+    def write(self, path, data):
+        self.pending[path] = data
+
+    def move(self, path, new_location):
+        super().move(path, new_location)
+        prefix = path + os.sep
+        for old in list(self.pending):
+            if old == path:
+                self.pending[new_location] = self.pending.pop(old)
+            elif old.startswith(prefix):
+                new = os.path.join(new_location, old[len(prefix) :])
+                self.pending[new] = self.pending.pop(old)
+
+    def remove(self, path):
+        super().remove(path)
+        prefix = path + os.sep
+        for old in list(self.pending):
+            if old == path or old.startswith(prefix):
+                del self.pending[old]
+
+    def take_pending(self) -> Dict[str, bytes]:
+        """Returns the buffered writes and empties the buffer."""
+        pending, self.pending = self.pending, {}
+        return pending
+
+
+class RopeRefactorer:
+    """
+    Applies rope refactorings to one repository through a long-lived project.
+
+    Keeping the rope project alive between calls keeps its parsed modules and
+    object database warm, so only files changed since the last call are
+    re-analyzed. A batch of refactorings is applied in memory, one after the
+    other, and the resulting files are written in a single pass at the end.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.abspath(root)
+        # rope would create a missing root, turning a mistyped path into a
+        # new empty project that stays cached for the life of the process.
+        if not os.path.isdir(self.root):
+            raise ValueError(f"Repository root '{root}' is not a directory.")
+        self.fs = BufferedFileSystemCommands()
+        # ropefolder=None keeps rope from creating a .ropeproject folder
+        # inside the repository under review.
+        self.project = Project(self.root, fscommands=self.fs, ropefolder=None)
+        self.lock = threading.Lock()
+
+    def apply(self, refactorings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Applies a batch of refactorings and writes the changed files once.
+
+        Each refactoring is a dictionary with an "op" key:
+
+        - rename: "path", "new_name" and optionally "symbol" or "offset".
+          Without a symbol or offset, the module itself is renamed.
+        - move: "path", "destination" and optionally "symbol" or "offset".
+          Moves a global to another module, or the module to a package.
+        - extract: "path", "start_line", "end_line" (1-based, inclusive),
+          "new_name" and optionally "kind" ("method" or "variable").
+
+        If any refactoring fails, the whole batch is undone.
+
+        Returns:
+            A dictionary with a description of each applied refactoring and
+            the list of files that were written.
+        """
+        from src.agents.refactoring_agent import write_files
+
+        with self.lock:
+            # Picks up edits made outside rope (e.g. by write_file) since
+            # the last call; unchanged modules stay cached.
+            self.project.validate(self.project.root)
+            applied = []
+            try:
+                for refactoring in refactorings:
+                    changes = self._get_changes(refactoring)
+                    self.project.do(changes)
+                    applied.append(changes)
+            except Exception:
+                self._undo(applied)
+                raise
+
+            pending = self.fs.take_pending()
+            files = {path: data.decode("utf-8") for path, data in pending.items()}
+            result = write_files(files)
+            if result.startswith("Error"):
+                # write_files restored the disk; this rolls back rope's view
+                # of it and any files the batch created, moved or removed.
+                self._undo(applied)
+                raise OSError(result)
+            return {
+                "applied": [changes.description for changes in applied],
+                "written": sorted(os.path.relpath(p, self.root) for p in files),
+            }
+
+    def _undo(self, applied: List[Any]) -> None:
+        """Undoes applied changes, newest first, and drops their buffered writes."""
+        for changes in reversed(applied):
+            self.project.history.undo(changes)
+        self.fs.take_pending()
+
+    def _get_changes(self, refactoring: Dict[str, Any]):
+        op = refactoring.get("op")
+        resource = self.project.get_resource(refactoring["path"])
+
+        if op == "rename":
+            offset = self._find_offset(resource, refactoring)
+            return Rename(self.project, resource, offset).get_changes(
+                refactoring["new_name"]
+            )
+
+        if op == "move":
+            offset = self._find_offset(resource, refactoring)
+            destination = self.project.get_resource(refactoring["destination"])
+            return create_move(self.project, resource, offset).get_changes(destination)
+
+        if op == "extract":
+            source = resource.read()
+            start, end = self._line_span(
+                source, refactoring["start_line"], refactoring["end_line"]
+            )
+            kind = refactoring.get("kind", "method")
+            extractor = {"method": ExtractMethod, "variable": ExtractVariable}[kind]
+            return extractor(self.project, resource, start, end).get_changes(
+                refactoring["new_name"]
+            )
+
+        raise ValueError(f"Unknown refactoring op: {op!r}")
+
+    @staticmethod
+    def _find_offset(resource, refactoring: Dict[str, Any]) -> Optional[int]:
+        """
+        Resolves the "offset" or "symbol" of a refactoring to a character offset.
+
+        A symbol is looked up as a def, class or top-level assignment first,
+        then as any whole-word occurrence.
+        """
+        if "offset" in refactoring:
+            return refactoring["offset"]
+        symbol = refactoring.get("symbol")
+        if not symbol:
+            return None
+        source = resource.read()
+        name = re.escape(symbol)
+        for pattern in (
+            rf"^\s*(?:async\s+def|def|class)\s+({name})\b",
+            rf"^({name})\s*[:=]",
+            rf"\b({name})\b",
+        ):
+            match = re.search(pattern, source, re.MULTILINE)
+            if match:
+                return match.start(1)
+        raise ValueError(f"Symbol '{symbol}' not found in {resource.path}")
+
+    @staticmethod
+    def _line_span(source: str, start_line: int, end_line: int):
+        """Converts a 1-based inclusive line range to character offsets."""
+        lines = source.splitlines(keepends=True)
+        start = sum(len(line) for line in lines[: start_line - 1])
+        end = sum(len(line) for line in lines[:end_line])
+        # Excludes leading indentation and the trailing newline, as rope expects.
+        while start < end and source[start] in " \t":
+            start += 1
+        while end > start and source[end - 1] in "\r\n":
+            end -= 1
+        return start, end
+
+
+# --- SHARED PROJECTS ---
+# One refactorer per repository root, kept for the life of the process.
+
+_refactorers: Dict[str, RopeRefactorer] = {}
+_refactorers_lock = threading.Lock()
+
+
+def get_refactorer(root: str) -> RopeRefactorer:
+    """Returns the long-lived refactorer for a repository root."""
+    root = os.path.abspath(root)
+    with _refactorers_lock:
+        if root not in _refactorers:
+            _refactorers[root] = RopeRefactorer(root)
+        return _refactorers[root]
@@ -0,0 +1,224 @@
+# In src/agents/security_agent.py
+
+import importlib.metadata
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.cache.shared_cache import SharedCache, content_hash
+from src.integrations.diff_parser import parse_diff
+
+# Bump this when the shape of cached scan results changes, so stale entries
+# from older versions are never read back. The installed bandit version is
+# part of the key as well, since a new release may report different issues.
+SCAN_CACHE_VERSION = "1"
+
+# Loaded lazily, once per process, because building it imports every plugin.
+_bandit_config = None
+_bandit_version: Optional[str] = None
+
+# Below this many uncached files, starting worker processes costs more than
+# scanning inline.
+MIN_PARALLEL_FILES = 4
+
+# One pool per process, created on first use with default_workers() processes
+# and reused by every scan, so the workers (and their loaded bandit plugins)
+# are only paid for once. It is never resized or shut down while the process
+# runs, so a scan can never find it closed under its feet.
+_scan_pool: Optional[ProcessPoolExecutor] = None
+_scan_pool_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    """Returns the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_scan_pool() -> ProcessPoolExecutor:
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            # "spawn" avoids forking a process that is running server threads.
+            context = multiprocessing.get_context("spawn")
+            _scan_pool = ProcessPoolExecutor(
+                max_workers=default_workers(), mp_context=context
+            )
+        return _scan_pool
+
+
+def _get_bandit_version() -> str:
+    global _bandit_version
+    if _bandit_version is None:
+        _bandit_version = importlib.metadata.version("bandit")
+    return _bandit_version
+
+
+# --- ATOMIC TOOLS ---
+
+
+def scan_source(file_path: str, source: str) -> List[Dict[str, Any]]:
+    """
+    Runs bandit over the source of a single Python file.
+
+    The source is scanned from a temporary copy, so the result depends only
+    on the content, which is what makes it safe to cache by content hash.
+
+    Args:
+        file_path: The path of the file in the repository, used in findings.
+        source: The full content of the file.
+
+    Returns:
+        A list of findings, one dictionary per issue bandit reported.
+    """
+    global _bandit_config
+    from bandit.core import config as bandit_config
+    from bandit.core import manager as bandit_manager
+
+    if _bandit_config is None:
+        _bandit_config = bandit_config.BanditConfig()
+
+    with tempfile.TemporaryDirectory(prefix="aegis-scan-") as tmp_dir:
+        tmp_path = os.path.join(tmp_dir, os.path.basename(file_path))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(source)
+        manager = bandit_manager.BanditManager(_bandit_config, "file", quiet=True)
+        manager.discover_files([tmp_path])
+        manager.run_tests()
+        issues = manager.get_issue_list()
+
+    return [
+        {
+            "file": file_path,
+            "line": issue.lineno,
+            "line_range": list(issue.linerange),
+            "test_id": issue.test_id,
+            "test_name": issue.test,
+            "severity": issue.severity,
+            "confidence": issue.confidence,
+            "message": issue.text,
+        }
+        for issue in issues
+    ]
+
+
+def _scan_item(item: Tuple[str, str]) -> List[Dict[str, Any]]:
+    # Module-level wrapper so ProcessPoolExecutor can pickle the task.
+    return scan_source(*item)
+
+
+def scan_changed_files(
+    diff: str,
+    repo_root: str = ".",
+    cache: Optional[SharedCache] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Scans only the Python files changed by a diff and reports findings on changed lines.
+
+    Files are read from repo_root, which should be a checkout of the PR head.
+    Results are cached per file by content hash, so a file that did not
+    change since the last scan is never rescanned. The remaining files are
+    fanned out across worker processes.
+
+    Args:
+        diff: A unified diff of the pull request.
+        repo_root: The directory containing the checked-out repository.
+        cache: An optional shared cache for per-file scan results.
+        max_workers: Maximum number of scanning processes. Defaults to the
+            number of CPUs available to this process; 1 scans inline.
+
+    Returns:
+        A list of findings whose line range touches an added line of the diff.
+    """
+    changed = {
+        path: lines
+        for path, lines in parse_diff(diff).items()
+        if path.endswith(".py") and lines
+    }
+
+    sources: Dict[str, str] = {}
+    for path in changed:
+        full_path = os.path.join(repo_root, path)
+        try:
+            with open(full_path, "r", encoding="utf-8") as f:
+                sources[path] = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            # The file is not available in this checkout; nothing to scan.
+            continue
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    version = f"{SCAN_CACHE_VERSION}:{_get_bandit_version()}"
+    keys = {
+        path: f"{version}:{content_hash(source)}" for path, source in sources.items()
+    }
+    to_scan = []
+    for path, source in sources.items():
+        cached = cache.get("security", keys[path]) if cache else None
+        if cached is None:
+            to_scan.append((path, source))
+        else:
+            # Cached findings may come from an identical file at another path.
+            results[path] = [dict(finding, file=path) for finding in cached]
+
+    workers = min(max_workers or default_workers(), len(to_scan))
+    if workers > 1 and len(to_scan) >= MIN_PARALLEL_FILES:
+        # The shared pool may be larger than this call's limit, so at most
+        # `workers` files are in flight at once; results stay in order.
+        pool = _get_scan_pool()
+        scanned = []
+        in_flight: Deque[Future] = deque()
+        for item in to_scan:
+            if len(in_flight) >= workers:
+                scanned.append(in_flight.popleft().result())
+            in_flight.append(pool.submit(_scan_item, item))
+        scanned.extend(future.result() for future in in_flight)
+    else:
+        scanned = [_scan_item(item) for item in to_scan]
+
+    for (path, _), findings in zip(to_scan, scanned):
+        results[path] = findings
+        if cache:
+            cache.set("security", keys[path], findings)
+
+    findings = []
+    for path, file_findings in results.items():
+        added = set(changed[path])
+        for finding in file_findings:
+            start, end = min(finding["line_range"]), max(finding["line_range"])
+            if any(start <= line <= end for line in added):
+                findings.append(finding)
+    return sorted(findings, key=lambda f: (f["file"], f["line"]))
+
+
+def format_findings(findings: List[Dict[str, Any]]) -> str:
+    """
+    Renders security findings as a section of a PR review comment.
+    """
+    if not findings:
+        return "### Security scan\nNo security issues found in the changed lines."
+    lines = ["### Security scan"]
+    for finding in findings:
+        lines.append(
+            f"- `{finding['file']}:{finding['line']}` "
+            f"[{finding['severity']}/{finding['confidence']}] "
+            f"{finding['test_id']} {finding['test_name']}: {finding['message']}"
+        )
+    return "\n".join(lines)
+
+
+class SecurityAgent:
+    """
+    An agent specialized in finding security issues in the changed code of a PR.
+    """
+
+    def __init__(self):
+        """Initializes the agent with a dictionary of its available tools."""
+        self.tools: Dict[str, Callable[..., Any]] = {
+            "scan_changed_files": scan_changed_files,
+        }
@@ -1,13 +1,51 @@
 # Module: aegis-code/api/server.py
 
-from typing import Dict
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from pydantic import BaseModel
+
+# Only the lightweight registry is imported here. Agents and integrations are
+# imported on first use, or by the warm-up task once the server is listening.
+from src.agents import registry
+from src.cache.shared_cache import get_job_store
+
+# Tracks the background warm-up so readiness probes can report on it.
+warmup_state: Dict[str, Any] = {"status": "pending", "timings": {}}
+
+
+async def run_warmup() -> None:
+    """
+    Pre-builds agent instances and prompts without blocking the event loop.
+    """
+    warmup_state["status"] = "running"
+    try:
+        warmup_state["timings"] = await asyncio.to_thread(registry.warm_up)
+        warmup_state["status"] = "complete"
+    except Exception as e:
+        # A failed warm-up is not fatal: agents are still built on first use.
+        warmup_state["status"] = f"failed: {e}"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Schedules the warm-up and returns immediately, so /health responds
+    as soon as the server starts listening.
+    """
+    task = asyncio.create_task(run_warmup())
+    yield
+    task.cancel()
+
 
 # Create an instance of the FastAPI class
 app = FastAPI(
     title="Aegis Code API",
     description="API for the multi-agent code modernizaion and PR review system.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -25,8 +63,74 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready", tags=["Status"])
+async def readiness_check() -> Dict[str, Any]:
+    """
+    Reports whether the background warm-up of agents and prompts has finished.
+
+    Unlike /health, this endpoint tells callers if the first workflow request
+    will still pay for importing and building the agents.
+
+    Returns:
+        A dictionary with the warm-up status and per-agent warm-up times.
+    """
+    return {
+        "ready": warmup_state["status"] == "complete",
+        "warmup": warmup_state["status"],
+        "timings": warmup_state["timings"],
+    }
+
+
+class ModernizeRequest(BaseModel):
+    code: Optional[str] = None
+
+
+class ReviewRequest(BaseModel):
+    pr_number: Optional[int] = None
+    diff: Optional[str] = None
+
+
+def run_job(job_id: str, workflow: Callable[..., Any], *args: Any) -> None:
+    """
+    Runs a workflow in the background and records its outcome in the job store.
+
+    The job store is shared by all worker processes, so the status can be
+    polled through /jobs regardless of which worker runs the job.
+    """
+    jobs = get_job_store()
+    jobs.update_job(job_id, "running")
+    try:
+        result = workflow(*args)
+    except Exception as e:
+        jobs.update_job(job_id, "failed", error=str(e))
+        return
+    jobs.update_job(job_id, "completed", result=result)
+
+
+def run_modernization_job(job_id: str, request: ModernizeRequest) -> None:
+    from src.teams.modernization_team import run_modernization
+
+    run_job(job_id, run_modernization, request.code or "")
+
+
+def run_review_job(job_id: str, request: ReviewRequest) -> None:
+    from src.teams.pr_review_team import fetch_pr_diff, run_pr_review
+
+    def workflow() -> Dict[str, Any]:
+        diff = request.diff
+        if diff is None:
+            diff = fetch_pr_diff(request.pr_number)
+        return run_pr_review(diff)
+
+    run_job(job_id, workflow)
+
+
+# The job endpoints are plain functions: their SQLite calls block, so FastAPI
+# runs them in its thread pool instead of on the event loop.
 @app.post("/modernize-codebase", tags=["Workflows"])
-async def modernize_codebase() -> Dict[str, str]:
+def modernize_codebase(
+    background_tasks: BackgroundTasks, request: Optional[ModernizeRequest] = None
+) -> Dict[str, str]:
     """
     Endpoint to trigger the codebase modernization workflow.
 
@@ -34,23 +138,71 @@ async def modernize_codebase() -> Dict[str, str]:
     and initiate the LangGraph-based modernization team.
 
     Returns:
-        A dictionary confirming that the process has been initiated.
+        A dictionary confirming that the process has been initiated,
+        with the id of the job to poll through /jobs.
 
     """
+    request = request or ModernizeRequest()
+    job_id = get_job_store().create_job("modernize_codebase")
+    background_tasks.add_task(run_modernization_job, job_id, request)
 
-    return {"message": "Modernization process successfully started."}
+    return {
+        "message": "Modernization process successfully started.",
+        "job_id": job_id,
+    }
 
 
 @app.post("/review-pr", tags=["Workflows"])
-async def review_pr() -> Dict[str, str]:
+def review_pr(
+    background_tasks: BackgroundTasks, request: Optional[ReviewRequest] = None
+) -> Dict[str, str]:
     """
     Endpoint to trigger the PR Review workflow.
 
     This endpoint will be called by a GitHUb Action when a review
     is requested on a pull request. It will trigger the PR review
-    agent team.
+    agent team on the given diff, or on the diff fetched for pr_number.
+
+    Returns:
+        A dictionary confirming that the review has been initiated,
+        with the id of the job to poll through /jobs.
+
+    Raises:
+        HTTPException: 422 if neither a diff nor a pr_number is given.
+    """
+    if request is None or (request.diff is None and request.pr_number is None):
+        raise HTTPException(
+            status_code=422, detail="Either 'diff' or 'pr_number' is required."
+        )
+    job_id = get_job_store().create_job("review_pr", {"pr_number": request.pr_number})
+    background_tasks.add_task(run_review_job, job_id, request)
+
+    return {"message": "PR review process successfully started.", "job_id": job_id}
+
+
+@app.get("/jobs", tags=["Jobs"])
+def list_jobs(limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Lists the most recent workflow jobs across all worker processes.
+
+    Returns:
+        A list of jobs, newest first.
+    """
+    return get_job_store().list_jobs(limit)
+
+
+@app.get("/jobs/{job_id}", tags=["Jobs"])
+def get_job(job_id: str) -> Dict[str, Any]:
+    """
+    Returns the status and result of a workflow job.
+
+    Jobs live in the shared job store, so this works no matter which
+    worker process accepted the job or is running it.
 
     Returns:
-        A dictionary confirming that the review has been initiated.
+        The job's kind, status, result or error, and timestamps.
     """
-    return {"message": "PR review process successfully started."}
+    job = get_job_store().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return job
@@ -0,0 +1,331 @@
+# Offline batch replay of historical requests through the review pipeline.
+#
+# Streams a JSONL dataset (by default the DVC-tracked data/raw/requests.jsonl),
+# runs each PR through the review and analysis stages with a local fake LLM,
+# and writes one JSON result per line as soon as it is ready.
+#
+# Each dataset line is a JSON object with an optional "id" or "pr_number"
+# and the diff to review, given by one of:
+#   "diff":      the diff text itself,
+#   "diff_path": a path to a cached diff, relative to the dataset file,
+#   "pr_number": looked up as <pr_number>.diff in --diff-dir.
+#
+# Usage:
+#   dvc pull data/raw
+#   python -m src.batch_replay data/raw/requests.jsonl --output replay.jsonl
+#   python -m src.batch_replay data/raw/requests.jsonl --concurrency 16 \
+#       --diff-dir data/raw/diffs --llm-latency-ms 200
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.agents import registry
+from src.agents.code_review_agent import CodeReviewAgent
+from src.integrations.fake_llm import FakeLLM
+from src.teams.modernization_team import run_modernization
+from src.teams.pr_review_team import run_pr_review
+
+DEFAULT_DATASET = "data/raw/requests.jsonl"
+
+
+def iter_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yields (line number, record) pairs from a JSONL file, one line at a time.
+
+    Blank lines are skipped. Lines that are not valid JSON, or whose JSON is
+    not an object, are yielded as a record with a "_parse_error" key, so they
+    show up as failures.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, {"_parse_error": str(e)}
+                continue
+            if not isinstance(record, dict):
+                error = f"expected a JSON object, got {type(record).__name__}"
+                record = {"_parse_error": error}
+            yield line_number, record
+
+
+def load_diff(record: Dict[str, Any], dataset_dir: str, diff_dir: Optional[str]) -> str:
+    """
+    Returns the diff for a record from the record itself or the local diff cache.
+    """
+    if "diff" in record:
+        return record["diff"]
+    if "diff_path" in record:
+        path = os.path.join(dataset_dir, record["diff_path"])
+    elif "pr_number" in record and diff_dir:
+        path = os.path.join(diff_dir, f"{record['pr_number']}.diff")
+    else:
+        raise ValueError("record has no 'diff', 'diff_path' or cached 'pr_number'")
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def analyze_changed_files(
+    changed_files: Dict[str, List[int]], repo_root: str
+) -> Dict[str, Any]:
+    """
+    Runs the structural analysis on the changed Python files found in repo_root.
+
+    Results come from the shared cache when the same content was analyzed before.
+    """
+    analyses = {}
+    for path in changed_files:
+        full_path = os.path.join(repo_root, path)
+        if not path.endswith(".py") or not os.path.isfile(full_path):
+            continue
+        with open(full_path, "r", encoding="utf-8") as f:
+            analyses[path] = run_modernization(f.read())["analysis"]
+    return analyses
+
+
+def replay_record(
+    line_number: int,
+    record: Dict[str, Any],
+    review_agent: CodeReviewAgent,
+    dataset_dir: str,
+    diff_dir: Optional[str],
+    repo_root: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Runs one record through the pipeline and returns its result line.
+
+    Failures are reported in the result instead of raised, so one bad record
+    does not stop a replay of thousands.
+    """
+    timings: Dict[str, float] = {}
+    result: Dict[str, Any] = {
+        "line": line_number,
+        "id": record.get("id", record.get("pr_number")),
+    }
+    start = time.perf_counter()
+    try:
+        if "_parse_error" in record:
+            raise ValueError(f"invalid JSON: {record['_parse_error']}")
+
+        stage_start = time.perf_counter()
+        diff = load_diff(record, dataset_dir, diff_dir)
+        timings["load_diff"] = time.perf_counter() - stage_start
+
+        # The replay threads already run records in parallel, so each scan
+        # stays in its thread instead of starting worker processes. Without
+        # --repo-root the security stage is skipped outright, whatever
+        # AEGIS_REPO_ROOT says.
+        review = run_pr_review(
+            diff,
+            repo_root=repo_root,
+            review_agent=review_agent,
+            timings=timings,
+            security=repo_root is not None,
+            scan_workers=1,
+        )
+
+        if repo_root:
+            stage_start = time.perf_counter()
+            review["analysis"] = analyze_changed_files(
+                review["changed_files"], repo_root
+            )
+            timings["analysis"] = time.perf_counter() - stage_start
+
+        result.update(status="ok", result=review)
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    result["latency"] = time.perf_counter() - start
+    result["timings"] = timings
+    return result
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class ReplayStats:
+    """Accumulates latencies and per-stage timings as results arrive."""
+
+    def __init__(self) -> None:
+        self.ok = 0
+        self.errors = 0
+        self.latencies: List[float] = []
+        self.stages: Dict[str, List[float]] = defaultdict(list)
+        self.llm_calls = 0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        if result["status"] == "ok":
+            self.ok += 1
+        else:
+            self.errors += 1
+        self.latencies.append(result["latency"])
+        for stage, seconds in result["timings"].items():
+            self.stages[stage].append(seconds)
+
+    def report(self, wall_time: float) -> str:
+        total = self.ok + self.errors
+        latencies = sorted(self.latencies)
+        lines = [
+            "--- Batch Replay Summary ---",
+            f"Records: {total} ({self.ok} ok, {self.errors} failed)",
+            f"Wall time: {wall_time:.2f} s",
+            f"Throughput: {total / wall_time if wall_time else 0.0:.1f} records/s",
+            f"LLM calls: {self.llm_calls}",
+            "Latency (ms): "
+            + ", ".join(
+                f"{name} {percentile(latencies, q) * 1000:.1f}"
+                for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+            )
+            + f", max {(latencies[-1] if latencies else 0.0) * 1000:.1f}",
+            "",
+            f"{'stage':<14}{'count':>8}{'mean (ms)':>12}{'p50 (ms)':>12}"
+            f"{'p95 (ms)':>12}{'total (s)':>12}",
+        ]
+        for stage, values in self.stages.items():
+            ordered = sorted(values)
+            lines.append(
+                f"{stage:<14}{len(values):>8}"
+                f"{statistics.fmean(values) * 1000:>12.2f}"
+                f"{percentile(ordered, 0.5) * 1000:>12.2f}"
+                f"{percentile(ordered, 0.95) * 1000:>12.2f}"
+                f"{sum(values):>12.2f}"
+            )
+        return "\n".join(lines)
+
+
+def run_replay(
+    dataset: str,
+    output: str,
+    concurrency: int = 8,
+    diff_dir: Optional[str] = None,
+    repo_root: Optional[str] = None,
+    llm_latency: float = 0.0,
+    limit: Optional[int] = None,
+) -> ReplayStats:
+    """
+    Replays a JSONL dataset through the review pipeline.
+
+    At most `concurrency` records are in flight at once, and reading the
+    dataset pauses while they are, so memory stays flat however large the
+    dataset is. Results are appended to `output` as they complete.
+
+    Returns:
+        The collected statistics; `ReplayStats.report` formats them.
+    """
+    dataset_dir = os.path.dirname(os.path.abspath(dataset))
+    llm = FakeLLM(latency=llm_latency)
+    stats = ReplayStats()
+    in_flight: Set[Future] = set()
+
+    # The agents print progress for every call, which would drown a replay
+    # of thousands of records, so their output is discarded.
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        review_agent = CodeReviewAgent(
+            llm=llm, system_prompt=registry.get_system_prompt("code_review")
+        )
+        with open(output, "w", encoding="utf-8") as out, ThreadPoolExecutor(
+            max_workers=concurrency
+        ) as pool:
+
+            def drain(return_when: str) -> None:
+                nonlocal in_flight
+                done, in_flight = wait(in_flight, return_when=return_when)
+                for future in done:
+                    result = future.result()
+                    stats.add(result)
+                    out.write(json.dumps(result) + "\n")
+                out.flush()
+
+            for count, (line_number, record) in enumerate(iter_records(dataset)):
+                if limit is not None and count >= limit:
+                    break
+                if len(in_flight) >= concurrency:
+                    drain(FIRST_COMPLETED)
+                in_flight.add(
+                    pool.submit(
+                        replay_record,
+                        line_number,
+                        record,
+                        review_agent,
+                        dataset_dir,
+                        diff_dir,
+                        repo_root,
+                    )
+                )
+            if in_flight:
+                drain(ALL_COMPLETED)
+
+    stats.llm_calls = llm.calls
+    return stats
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a JSONL dataset of PRs through the review pipeline."
+    )
+    parser.add_argument("dataset", nargs="?", default=DEFAULT_DATASET)
+    parser.add_argument("--output", default="replay_results.jsonl")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--diff-dir", help="Directory of cached diffs named <pr_number>.diff."
+    )
+    parser.add_argument(
+        "--repo-root",
+        help="Checkout used by the security and analysis stages (skipped if unset).",
+    )
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency of each fake LLM call.",
+    )
+    parser.add_argument("--limit", type=int, help="Stop after this many records.")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    if not os.path.exists(args.dataset):
+        print(
+            f"Error: Dataset '{args.dataset}' not found. "
+            "Run 'dvc pull data/raw' to fetch it."
+        )
+        return 1
+
+    start = time.perf_counter()
+    stats = run_replay(
+        args.dataset,
+        args.output,
+        concurrency=args.concurrency,
+        diff_dir=args.diff_dir,
+        repo_root=args.repo_root,
+        llm_latency=args.llm_latency_ms / 1000,
+        limit=args.limit,
+    )
+    print(stats.report(time.perf_counter() - start))
+    print(f"\nResults written to '{args.output}'.")
+    return 0 if stats.errors == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
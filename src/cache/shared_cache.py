@@ -0,0 +1,266 @@
+# In src/cache/shared_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+# All worker processes open the same SQLite file. WAL mode lets readers run
+# concurrently with a writer, so one worker can serve /jobs while another
+# records progress.
+DEFAULT_CACHE_PATH = ".aegis_cache/shared.sqlite3"
+CACHE_PATH_ENV_VAR = "AEGIS_CACHE_PATH"
+
+# Finished jobs are kept for a week, then purged together with expired cache
+# entries. Pruning runs at most once per interval in each process.
+JOB_RETENTION_SECONDS = 7 * 24 * 3600
+PRUNE_INTERVAL_SECONDS = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT,
+    result TEXT,
+    error TEXT,
+    worker_pid INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (created_at);
+"""
+
+
+def content_hash(content: str) -> str:
+    """Returns a stable cache key for a piece of text, such as a source file."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class _SQLiteStore:
+    """
+    Owns the SQLite connections for one database file.
+
+    SQLite connections cannot be shared between threads, so each thread
+    (FastAPI runs sync endpoints and background tasks in a thread pool)
+    lazily opens its own connection.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._last_prune = 0.0
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: every statement is its own short transaction,
+            # which keeps the write lock held for as little time as possible.
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """
+        Deletes expired cache entries and jobs older than the retention period.
+
+        Jobs that are still queued or running are kept regardless of age.
+        """
+        now = time.time() if now is None else now
+        self._last_prune = now
+        conn = self._connect()
+        conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+            (now,),
+        )
+        conn.execute(
+            "DELETE FROM jobs WHERE created_at < ? "
+            "AND status NOT IN ('queued', 'running')",
+            (now - JOB_RETENTION_SECONDS,),
+        )
+
+    def _maybe_prune(self) -> None:
+        # Called on writes; a race between threads only means an extra prune.
+        if time.time() - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+            self.prune()
+
+
+class SharedCache(_SQLiteStore):
+    """
+    A key-value cache shared by every worker process on the machine.
+
+    Values are stored as JSON, grouped by namespace (e.g. "analysis",
+    "pr_diff", "security"), and may carry an expiry time in seconds.
+    """
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Returns the cached value, or None if it is missing or expired."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        if row["expires_at"] is not None and row["expires_at"] < time.time():
+            self.delete(namespace, key)
+            return None
+        return json.loads(row["value"])
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Stores a JSON-serializable value, replacing any previous one."""
+        self._maybe_prune()
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), expires_at),
+        )
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Returns the cached value, computing and storing it on a miss.
+
+        Two workers missing at the same moment may both compute the value;
+        the results are identical, so the last write simply wins.
+        """
+        value = self.get(namespace, key)
+        if value is None:
+            value = compute()
+            self.set(namespace, key, value, ttl)
+        return value
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._connect().execute(
+            "DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+        )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Removes every entry, or only those of one namespace."""
+        if namespace is None:
+            self._connect().execute("DELETE FROM cache")
+        else:
+            self._connect().execute(
+                "DELETE FROM cache WHERE namespace = ?", (namespace,)
+            )
+
+
+class JobStore(_SQLiteStore):
+    """
+    Records workflow jobs so their status can be read from any worker.
+    """
+
+    def create_job(self, kind: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Registers a new queued job and returns its id."""
+        self._maybe_prune()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connect().execute(
+            "INSERT INTO jobs (job_id, kind, status, params, worker_pid, "
+            "created_at, updated_at) VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+            (job_id, kind, json.dumps(params or {}), os.getpid(), now, now),
+        )
+        return job_id
+
+    def update_job(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Moves a job to a new status, optionally recording its result or error."""
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, worker_pid = ?, "
+            "updated_at = ? WHERE job_id = ?",
+            (
+                status,
+                json.dumps(result) if result is not None else None,
+                error,
+                os.getpid(),
+                time.time(),
+                job_id,
+            ),
+        )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a job as a dictionary, or None if the id is unknown."""
+        row = (
+            self._connect()
+            .execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            .fetchone()
+        )
+        return self._to_dict(row) if row else None
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Returns the most recently created jobs, newest first."""
+        rows = (
+            self._connect()
+            .execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))
+            .fetchall()
+        )
+        return [self._to_dict(row) for row in rows]
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+
+# --- PER-PROCESS SINGLETONS ---
+# Each worker opens the database once; the path is passed down from
+# src/main.py through an environment variable, since workers are spawned.
+
+_shared_cache: Optional[SharedCache] = None
+_job_store: Optional[JobStore] = None
+
+
+def get_cache_path() -> str:
+    return os.environ.get(CACHE_PATH_ENV_VAR, DEFAULT_CACHE_PATH)
+
+
+def get_shared_cache() -> SharedCache:
+    """Returns this process's handle on the shared cache."""
+    global _shared_cache
+    if _shared_cache is None or _shared_cache.path != get_cache_path():
+        _shared_cache = SharedCache(get_cache_path())
+    return _shared_cache
+
+
+def get_job_store() -> JobStore:
+    """Returns this process's handle on the shared job store."""
+    global _job_store
+    if _job_store is None or _job_store.path != get_cache_path():
+        _job_store = JobStore(get_cache_path())
+    return _job_store
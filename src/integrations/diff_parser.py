@@ -0,0 +1,56 @@
+# In src/integrations/diff_parser.py
+
+import re
+from typing import Dict, List
+
+# Matches the hunk header of a unified diff, e.g. "@@ -10,7 +12,9 @@ def foo():".
+HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+
+def parse_diff(diff_text: str) -> Dict[str, List[int]]:
+    """
+    Parses a unified diff and returns the added lines of every changed file.
+
+    The review agents only care about the new side of a pull request, so this
+    helper maps each file in the diff to the line numbers (in the new version
+    of the file) that were added or modified. Deleted files are skipped.
+
+    Args:
+        diff_text: A string containing a unified diff, as returned by get_pr_diff.
+
+    Returns:
+        A dictionary mapping file paths to a sorted list of added line numbers.
+    """
+    changes: Dict[str, List[int]] = {}
+    current_file = None
+    new_line = 0
+
+    for line in diff_text.splitlines():
+        if line.startswith("+++ "):
+            path = line[4:].split("\t", 1)[0].strip()
+            if path == "/dev/null":
+                current_file = None
+                continue
+            current_file = path[2:] if path.startswith("b/") else path
+            changes.setdefault(current_file, [])
+            continue
+        if line.startswith("--- "):
+            continue
+
+        match = HUNK_HEADER_RE.match(line)
+        if match:
+            new_line = int(match.group(1))
+            continue
+
+        if current_file is None:
+            continue
+
+        if line.startswith("+"):
+            changes[current_file].append(new_line)
+            new_line += 1
+        elif line.startswith(" "):
+            new_line += 1
+        # Removed lines ("-") and "\ No newline at end of file" markers do
+        # not advance the line counter of the new file.
+
+    return changes
@@ -0,0 +1,38 @@
+# In src/integrations/fake_llm.py
+
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class FakeLLMResponse:
+    content: str
+
+
+class FakeLLM:
+    """
+    A deterministic chat model with the same `invoke` shape as LangChain's.
+
+    It answers with a canned review after an optional simulated latency, and
+    counts calls so offline runs can report how many LLM round-trips a
+    workflow would have made. Used by benchmarks and batch replays.
+    """
+
+    def __init__(
+        self,
+        reply: str = "LGTM: no issues found by the fake LLM.",
+        latency: float = 0.0,
+    ) -> None:
+        self.reply = reply
+        self.latency = latency
+        self.calls = 0
+        # Replays call one instance from many threads.
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt) -> FakeLLMResponse:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return FakeLLMResponse(content=self.reply)
@@ -1,27 +1,58 @@
 # Main entrypoint for the Aegis Code application that uses Hydra for configuration.
+#
+# Usage:
+#   python -m src.main
+#   python -m src.main api.port=9000 logging.level=DEBUG
+#   python -m src.main api.workers=4
+
+import os
 
 import hydra
 from omegaconf import DictConfig, OmegaConf
 
 
-@hydra.main(config_path="config", config_name="config", version_base=None)
+@hydra.main(config_path="../config", config_name="config", version_base=None)
 def main(cfg: DictConfig) -> None:
     """
-    Main funstion orchstrated by HYdra.
+    Main function orchestrated by Hydra.
+
+    This function loads the configuration and starts the FastAPI server
+    on the host and port from the `api` section. The server is passed as an
+    import string so uvicorn only imports it once, and heavy agents are
+    warmed up in the background after the server starts listening.
 
-    This function will load the configuration and eventually start
-    FastAPI server or other application workflows.
+    With `api.workers` above 1, uvicorn spawns that many processes. They
+    share analysis results and job state through the SQLite database at
+    `cache.path`, whose location is handed to them via the environment.
 
     Args:
         cfg: A dictionary-like object holding the configuration
         from YAML files.
 
     """
+    # Imported here so that `--help` and config errors stay fast.
+    import uvicorn
 
-    print("Configuration loaded successfully!")
-    print(OmegaConf.to_yaml)
+    from src.cache.shared_cache import CACHE_PATH_ENV_VAR
+    from src.teams.pr_review_team import REPO_ROOT_ENV_VAR
 
-    # Start the FastAPI server and padd the configuration to it.
+    print("Configuration loaded successfully!")
+    print(OmegaConf.to_yaml(cfg))
+
+    # Hydra may change the working directory, so the path is made absolute.
+    os.environ[CACHE_PATH_ENV_VAR] = hydra.utils.to_absolute_path(cfg.cache.path)
+    if cfg.review.repo_root:
+        os.environ[REPO_ROOT_ENV_VAR] = hydra.utils.to_absolute_path(
+            cfg.review.repo_root
+        )
+
+    uvicorn.run(
+        "src.api.server:app",
+        host=cfg.api.host,
+        port=cfg.api.port,
+        workers=cfg.api.workers,
+        log_level=str(cfg.logging.level).lower(),
+    )
 
 
 if __name__ == "__main__":
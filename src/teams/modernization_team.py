@@ -0,0 +1,27 @@
+# In src/teams/modernization_team.py
+
+import json
+from typing import Any, Dict
+
+from src.agents import registry
+from src.cache.shared_cache import content_hash, get_shared_cache
+
+
+def run_modernization(code: str) -> Dict[str, Any]:
+    """
+    Runs the modernization workflow on a piece of code.
+
+    The structural analysis is cached in the shared cache by content hash,
+    so any worker that sees the same code again skips re-parsing it.
+
+    Args:
+        code: A string containing the Python source to modernize.
+
+    Returns:
+        A JSON-serializable dictionary with the code's structural analysis.
+    """
+    analysis_tool = registry.get_agent("code_analysis").tool
+    analysis = get_shared_cache().get_or_compute(
+        "analysis", content_hash(code), lambda: json.loads(analysis_tool(code))
+    )
+    return {"analysis": analysis}
@@ -0,0 +1,109 @@
+# In src/teams/pr_review_team.py
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from src.agents import registry
+from src.cache.shared_cache import get_shared_cache
+from src.integrations.diff_parser import parse_diff
+
+# Directory holding a checkout of the PR head. The security stage reads the
+# changed files from here; it is skipped when no checkout is configured.
+REPO_ROOT_ENV_VAR = "AEGIS_REPO_ROOT"
+
+# Fetched diffs are shared between workers for a short while, so retried or
+# repeated reviews of a PR do not refetch it. New pushes show up once the
+# entry expires.
+PR_DIFF_TTL_SECONDS = 60
+
+
+def fetch_pr_diff(pr_number: int) -> str:
+    """
+    Fetches a pull request diff from GitHub, raising if the tool reports an error.
+
+    Diffs are cached in the shared cache under "pr_diff" for
+    PR_DIFF_TTL_SECONDS; errors are never cached. The GitHub integration is
+    imported here rather than at module level, so PyGithub is only loaded by
+    workers that actually talk to GitHub.
+    """
+    cache = get_shared_cache()
+    key = f"{os.environ.get('GITHUB_REPOSITORY', '')}#{pr_number}"
+    diff = cache.get("pr_diff", key)
+    if diff is not None:
+        return diff
+
+    from src.integrations.github_tools import get_pr_diff
+
+    diff = get_pr_diff(pr_number)
+    if diff.startswith(("Error", "An unexpected error")):
+        raise RuntimeError(diff)
+    cache.set("pr_diff", key, diff, ttl=PR_DIFF_TTL_SECONDS)
+    return diff
+
+
+@contextmanager
+def _timed(timings: Optional[Dict[str, float]], stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[stage] = time.perf_counter() - start
+
+
+def run_pr_review(
+    diff: str,
+    repo_root: Optional[str] = None,
+    review_agent: Any = None,
+    timings: Optional[Dict[str, float]] = None,
+    security: bool = True,
+    scan_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the PR review workflow on a diff.
+
+    The CodeReviewAgent reviews the diff, and the SecurityAgent scans the
+    changed lines of the PR's Python files with bandit. Security findings
+    are returned as structured data and appended to the review comment.
+
+    Args:
+        diff: A unified diff of the pull request.
+        repo_root: A checkout of the PR head for the security stage.
+            Defaults to the AEGIS_REPO_ROOT environment variable.
+        review_agent: The agent that writes the review. Defaults to the
+            shared CodeReviewAgent.
+        timings: If given, filled with the duration in seconds of each stage
+            ("parse_diff", "review" and, when it runs, "security").
+        security: Set to False to skip the security stage even when a
+            repository root is configured.
+        scan_workers: Maximum number of bandit processes for the security
+            stage. Defaults to the number of available CPUs.
+
+    Returns:
+        A JSON-serializable dictionary with the changed lines per file,
+        the review comment and the security findings.
+    """
+    with _timed(timings, "parse_diff"):
+        changed_files = parse_diff(diff)
+
+    with _timed(timings, "review"):
+        review = (review_agent or registry.get_agent("code_review")).run(diff)
+
+    repo_root = repo_root or os.environ.get(REPO_ROOT_ENV_VAR)
+    findings = []
+    if security and repo_root:
+        from src.agents.security_agent import format_findings
+
+        with _timed(timings, "security"):
+            scan = registry.get_agent("security").tools["scan_changed_files"]
+            findings = scan(
+                diff,
+                repo_root=repo_root,
+                cache=get_shared_cache(),
+                max_workers=scan_workers,
+            )
+        review = f"{review}\n\n{format_findings(findings)}"
+
+    return {"changed_files": changed_files, "review": review, "findings": findings}
@@ -0,0 +1,41 @@
+# In src/tests/test_agents.py
+
+import sys
+
+from src.agents import registry
+from src.agents.prompts import AGENT_CONSTITUTION, PR_REVIEW_AGENT_PROMPT
+
+
+def test_get_agent_imports_lazily_and_caches_instance(mocker):
+    """
+    Tests that an agent module is only imported on first use and that
+    later calls return the same instance.
+    """
+    mocker.patch.dict(registry._agents, clear=True)
+    sys.modules.pop("src.agents.documentation_agent", None)
+
+    agent = registry.get_agent("documentation")
+
+    assert "src.agents.documentation_agent" in sys.modules
+    assert type(agent).__name__ == "DocumentationAgent"
+    assert registry.get_agent("documentation") is agent
+
+
+def test_warm_up_builds_every_agent_and_prompt(mocker):
+    """
+    Tests that warm_up instantiates all registered agents and assembles
+    their system prompts from the shared constitution, and that agents use
+    the prompt cached by the registry.
+    """
+    mocker.patch.dict(registry._agents, clear=True)
+    mocker.patch.dict(registry._system_prompts, clear=True)
+
+    timings = registry.warm_up()
+
+    assert set(timings) == set(registry.AGENT_REGISTRY)
+    assert set(registry._agents) == set(registry.AGENT_REGISTRY)
+    review_prompt = registry.get_system_prompt("code_review")
+    assert AGENT_CONSTITUTION.strip() in review_prompt
+    assert PR_REVIEW_AGENT_PROMPT.strip() in review_prompt
+    assert registry.get_agent("code_review").system_prompt is review_prompt
+    assert registry.get_system_prompt("documentation") is None
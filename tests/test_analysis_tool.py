@@ -1,4 +1,7 @@
 import json
+
+import pytest
+
 from src.agents.code_analysis_agent import analyze_code_structure
 
 
@@ -44,3 +47,103 @@ def test_analyze_code_with_syntax_error():
 
     assert "error" in result
     assert result["error"] == "Invalid Python syntax"
+
+
+def test_outline_mode_extracts_top_level_structure():
+    """
+    Tests that the token-based outline reports top-level imports, classes,
+    methods, functions, their arguments and docstring line spans.
+    """
+    sample_code = '''
+import os.path as osp
+from typing import (
+    Dict,
+    List,
+)
+
+
+@decorator
+class MyClass(Base, metaclass=Meta):
+    """Class docstring."""
+
+    def my_method(self, a, *args, b=1):
+        """Method
+        docstring."""
+
+        def nested():
+            pass
+
+
+async def fetch(a, /, b: Dict[str, int] = {"k": 1}, *, c) -> List[str]:
+    pass
+'''
+    result = json.loads(analyze_code_structure(sample_code, mode="outline"))
+
+    assert result["mode"] == "outline"
+    assert result["imports"] == [
+        {"module": "os.path", "as": "osp"},
+        {"module": "typing.Dict", "as": None},
+        {"module": "typing.List", "as": None},
+    ]
+    [cls] = result["classes"]
+    assert cls["name"] == "MyClass"
+    assert cls["bases"] == ["Base"]
+    assert cls["docstring_span"] == [11, 11]
+    assert cls["methods"] == [
+        {"name": "my_method", "args": ["self", "a"], "docstring_span": [14, 15]}
+    ]
+    assert result["functions"] == [
+        {"name": "fetch", "args": ["b"], "docstring_span": None}
+    ]
+
+
+def test_auto_mode_outlines_large_files_and_deeply_nested_code(monkeypatch):
+    """
+    Tests that auto mode switches to the outline above the size threshold,
+    and that the full analysis falls back to it when the AST is too deep.
+    """
+    from src.agents import code_analysis_agent
+
+    small_code = "def my_function(x):\n    return x\n"
+    assert "mode" not in json.loads(analyze_code_structure(small_code))
+
+    monkeypatch.setattr(code_analysis_agent, "OUTLINE_SIZE_THRESHOLD", 10)
+    result = json.loads(analyze_code_structure(small_code))
+    assert result["mode"] == "outline"
+    assert result["functions"][0]["args"] == ["x"]
+
+    deep_code = "x = " + "1 + " * 200_000 + "1\ndef after():\n    pass\n"
+    result = json.loads(analyze_code_structure(deep_code, mode="full"))
+    assert result["mode"] == "outline"
+    assert result["functions"][0]["name"] == "after"
+
+
+def test_outline_handles_semicolons_and_lambda_defaults():
+    """
+    Tests that the outline ends imports at a semicolon and does not split
+    parameters on the commas of a lambda default, matching the full analysis.
+    """
+    sample_code = (
+        "import os; import sys\n"
+        "from a import b; c = 1\n"
+        "x = 1; import json\n"
+        "\n"
+        "\n"
+        "def f(a=lambda x, y: x, b=2, c=lambda: (1, 2), d=lambda p, q=1: p):\n"
+        "    pass\n"
+    )
+    outline = json.loads(analyze_code_structure(sample_code, mode="outline"))
+    full = json.loads(analyze_code_structure(sample_code, mode="full"))
+
+    assert [i["module"] for i in outline["imports"]] == ["os", "sys", "a.b", "json"]
+    assert outline["functions"][0]["args"] == ["a", "b", "c", "d"]
+    assert outline["imports"] == full["imports"]
+    assert outline["functions"][0]["args"] == full["functions"][0]["args"]
+
+
+def test_unknown_mode_is_rejected():
+    """
+    Tests that a mode other than auto, full or outline raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        analyze_code_structure("x = 1\n", mode="fast")
@@ -0,0 +1,98 @@
+# In src/tests/test_api.py
+
+from fastapi.testclient import TestClient
+
+from src.api import server
+
+
+def test_health_check():
+    """
+    Tests that the health endpoint reports the service as running.
+    """
+    with TestClient(server.app) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_ready_reports_warmup_state(mocker):
+    """
+    Tests that the readiness endpoint reports the background warm-up and
+    becomes ready once it has completed.
+    """
+    mocker.patch.object(server.registry, "warm_up", return_value={"code_review": 0.01})
+    mocker.patch.dict(server.warmup_state, {"status": "pending", "timings": {}})
+
+    with TestClient(server.app) as client:
+        # Startup schedules the warm-up; the health check does not wait for it.
+        assert client.get("/health").status_code == 200
+        for _ in range(100):
+            body = client.get("/ready").json()
+            if body["ready"]:
+                break
+
+    assert body["warmup"] == "complete"
+    assert body["timings"] == {"code_review": 0.01}
+
+
+def test_review_job_status_is_readable_through_jobs(tmp_path, monkeypatch):
+    """
+    Tests that a review request creates a job in the shared job store and
+    that its result can be fetched from /jobs once the workflow has run.
+    """
+    monkeypatch.setenv("AEGIS_CACHE_PATH", str(tmp_path / "shared.sqlite3"))
+    diff = "--- a/app.py\n+++ b/app.py\n@@ -1,1 +1,1 @@\n-x = 1\n+x = 2\n"
+
+    with TestClient(server.app) as client:
+        response = client.post("/review-pr", json={"diff": diff})
+        job_id = response.json()["job_id"]
+        job = client.get(f"/jobs/{job_id}").json()
+        listed = client.get("/jobs").json()
+        missing = client.get("/jobs/does-not-exist")
+
+    assert response.status_code == 200
+    assert job["status"] == "completed"
+    assert job["result"]["changed_files"] == {"app.py": [1]}
+    assert [j["job_id"] for j in listed] == [job_id]
+    assert missing.status_code == 404
+
+
+def test_review_requires_a_diff_or_pr_number(tmp_path, monkeypatch):
+    """
+    Tests that a review request without a diff or pr_number is rejected
+    before any job is created.
+    """
+    monkeypatch.setenv("AEGIS_CACHE_PATH", str(tmp_path / "shared.sqlite3"))
+
+    with TestClient(server.app) as client:
+        bare = client.post("/review-pr")
+        empty = client.post("/review-pr", json={})
+        listed = client.get("/jobs").json()
+
+    assert bare.status_code == 422
+    assert empty.status_code == 422
+    assert listed == []
+
+
+def test_review_by_pr_number_shares_the_fetched_diff(tmp_path, monkeypatch, mocker):
+    """
+    Tests that the diff fetched for a pr_number is cached, so a second review
+    of the same PR does not call GitHub again.
+    """
+    monkeypatch.setenv("AEGIS_CACHE_PATH", str(tmp_path / "shared.sqlite3"))
+    diff = "--- a/app.py\n+++ b/app.py\n@@ -1,1 +1,1 @@\n-x = 1\n+x = 2\n"
+    get_pr_diff = mocker.patch(
+        "src.integrations.github_tools.get_pr_diff", return_value=diff
+    )
+
+    with TestClient(server.app) as client:
+        job_ids = [
+            client.post("/review-pr", json={"pr_number": 7}).json()["job_id"]
+            for _ in range(2)
+        ]
+        jobs = [client.get(f"/jobs/{job_id}").json() for job_id in job_ids]
+
+    assert [job["status"] for job in jobs] == ["completed", "completed"]
+    assert jobs[1]["result"]["changed_files"] == {"app.py": [1]}
+    get_pr_diff.assert_called_once_with(7)
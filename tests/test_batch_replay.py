@@ -0,0 +1,78 @@
+# In src/tests/test_batch_replay.py
+
+import json
+
+from src.batch_replay import percentile, run_replay
+
+DIFF = "--- a/app.py\n+++ b/app.py\n@@ -1,1 +1,2 @@\n-x = 1\n+x = 2\n+y = 3\n"
+
+
+def test_replay_streams_records_and_writes_a_result_per_line(tmp_path, monkeypatch):
+    """
+    Tests that the replay reviews inline, cached and per-PR diffs with the
+    fake LLM, reports bad records (including JSON that is not an object) as
+    failures, and records stage timings.
+    Without a repo root the security stage is skipped, even when one is
+    configured through the environment.
+    """
+    monkeypatch.setenv("AEGIS_REPO_ROOT", str(tmp_path))
+    diff_dir = tmp_path / "diffs"
+    diff_dir.mkdir()
+    (diff_dir / "7.diff").write_text(DIFF)
+    (tmp_path / "cached.diff").write_text(DIFF)
+    dataset = tmp_path / "requests.jsonl"
+    dataset.write_text(
+        json.dumps({"id": "inline", "diff": DIFF})
+        + "\n"
+        + json.dumps({"id": "by-path", "diff_path": "cached.diff"})
+        + "\n\n"
+        + json.dumps({"pr_number": 7})
+        + "\n"
+        + json.dumps({"pr_number": 8})
+        + "\n"
+        + "not json\n"
+        + "[1, 2]\n"
+        + "null\n"
+    )
+    output = tmp_path / "results.jsonl"
+
+    stats = run_replay(str(dataset), str(output), concurrency=2, diff_dir=str(diff_dir))
+
+    results = {r["line"]: r for r in map(json.loads, output.read_text().splitlines())}
+    assert sorted(results) == [1, 2, 4, 5, 6, 7, 8]
+    assert [results[n]["status"] for n in (1, 2, 4)] == ["ok", "ok", "ok"]
+    assert results[4]["id"] == 7
+    assert results[1]["result"]["changed_files"] == {"app.py": [1, 2]}
+    assert results[1]["result"]["review"].startswith("LGTM")
+    assert results[5]["status"] == "error"
+    assert "invalid JSON" in results[6]["error"]
+    assert "expected a JSON object, got list" in results[7]["error"]
+    assert "got NoneType" in results[8]["error"]
+    assert (stats.ok, stats.errors, stats.llm_calls) == (3, 4, 3)
+    assert set(stats.stages) == {"load_diff", "parse_diff", "review"}
+    assert "Records: 7 (3 ok, 4 failed)" in stats.report(wall_time=1.0)
+
+
+def test_replay_honours_limit(tmp_path):
+    """
+    Tests that --limit stops reading the dataset after that many records.
+    """
+    dataset = tmp_path / "requests.jsonl"
+    dataset.write_text((json.dumps({"diff": DIFF}) + "\n") * 10)
+    output = tmp_path / "results.jsonl"
+
+    stats = run_replay(str(dataset), str(output), concurrency=3, limit=4)
+
+    assert stats.ok == 4
+    assert len(output.read_text().splitlines()) == 4
+
+
+def test_percentile_uses_nearest_rank():
+    """
+    Tests the nearest-rank percentile used in the latency summary.
+    """
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
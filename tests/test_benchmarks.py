@@ -0,0 +1,53 @@
+# In src/tests/test_benchmarks.py
+
+from benchmarks.run_benchmarks import compare_to_baseline
+from benchmarks.synthetic_repo import RepoSize, generate_diff, generate_repository
+from src.agents.code_analysis_agent import analyze_code_structure
+from src.integrations.diff_parser import parse_diff
+
+
+def test_synthetic_repository_is_reproducible_and_parsable(tmp_path):
+    """
+    Tests that the generator is deterministic for a seed, emits valid Python,
+    and produces a diff that touches every generated file.
+    """
+    size = RepoSize(
+        files=3,
+        classes_per_file=1,
+        methods_per_class=2,
+        functions_per_file=2,
+        hunks_per_file=2,
+    )
+    paths = generate_repository(str(tmp_path / "a"), size, seed=7)
+    generate_repository(str(tmp_path / "b"), size, seed=7)
+
+    sources = {}
+    for path in paths:
+        first = (tmp_path / "a" / path).read_text()
+        assert first == (tmp_path / "b" / path).read_text()
+        assert "error" not in analyze_code_structure(first)
+        sources[path] = first
+
+    changes = parse_diff(generate_diff(sources, size.hunks_per_file, seed=7))
+    assert sorted(changes) == sorted(paths)
+    assert all(len(lines) == 2 * size.hunks_per_file for lines in changes.values())
+
+
+def test_compare_to_baseline_flags_only_slowdowns_past_threshold():
+    """
+    Tests that a case is reported only when it is slower than the threshold
+    allows, and that skipped cases are ignored.
+    """
+    baseline = {"results": {"fast": {"median": 1.0}, "slow": {"median": 1.0}}}
+    current = {
+        "results": {
+            "fast": {"median": 1.1},
+            "slow": {"median": 1.5},
+            "api": {"skipped": "missing dependency"},
+        }
+    }
+
+    regressions = compare_to_baseline(current, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
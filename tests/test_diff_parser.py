@@ -0,0 +1,42 @@
+# In src/tests/test_diff_parser.py
+
+from src.integrations.diff_parser import parse_diff
+
+
+def test_parse_diff_maps_added_lines_to_new_file_numbers():
+    """
+    Tests that parse_diff reports added lines using the new file's numbering,
+    skipping removed lines and context lines.
+    """
+    diff = (
+        "diff --git a/app.py b/app.py\n"
+        "--- a/app.py\n"
+        "+++ b/app.py\n"
+        "@@ -1,3 +1,4 @@\n"
+        " import os\n"
+        "-x = 1\n"
+        "+x = 2\n"
+        "+y = 3\n"
+        " print(x)\n"
+        "@@ -10,2 +11,2 @@\n"
+        " def f():\n"
+        "+    return 1\n"
+        "diff --git a/new.py b/new.py\n"
+        "--- /dev/null\n"
+        "+++ b/new.py\n"
+        "@@ -0,0 +1,1 @@\n"
+        "+print('hi')\n"
+    )
+
+    changes = parse_diff(diff)
+
+    assert changes == {"app.py": [2, 3, 12], "new.py": [1]}
+
+
+def test_parse_diff_skips_deleted_files():
+    """
+    Tests that files removed by the diff are not reported as changed.
+    """
+    diff = "--- a/old.py\n+++ /dev/null\n@@ -1,1 +0,0 @@\n-print('bye')\n"
+
+    assert parse_diff(diff) == {}
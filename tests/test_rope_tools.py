@@ -0,0 +1,189 @@
+# In src/tests/test_rope_tools.py
+
+import json
+import os
+
+from src.agents import refactoring_agent
+from src.agents.refactoring_agent import rope_refactor, write_files
+
+
+def _make_project(root):
+    package = root / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "util.py").write_text("")
+    (package / "core.py").write_text(
+        "def compute_total(items):\n"
+        "    total = 0\n"
+        "    for item in items:\n"
+        "        total += item * 2\n"
+        "    return total\n"
+        "\n"
+        "\n"
+        "LIMIT = 10\n"
+    )
+    (package / "app.py").write_text(
+        "from pkg.core import compute_total, LIMIT\n"
+        "\n"
+        "\n"
+        "def main():\n"
+        "    return compute_total(range(LIMIT))\n"
+    )
+
+
+def test_rope_batch_applies_refactorings_with_one_write(tmp_path, mocker):
+    """
+    Tests that a rename, an extract and a move are applied in sequence,
+    each seeing the previous result, and written through one batched write.
+    """
+    _make_project(tmp_path)
+    spy = mocker.spy(refactoring_agent, "write_files")
+
+    result = rope_refactor(
+        str(tmp_path),
+        [
+            {
+                "op": "rename",
+                "path": "pkg/core.py",
+                "symbol": "compute_total",
+                "new_name": "sum_doubled",
+            },
+            {
+                "op": "extract",
+                "path": "pkg/core.py",
+                "start_line": 3,
+                "end_line": 4,
+                "new_name": "accumulate",
+            },
+            {
+                "op": "move",
+                "path": "pkg/core.py",
+                "symbol": "LIMIT",
+                "destination": "pkg/util.py",
+            },
+        ],
+    )
+
+    summary = json.loads(result)
+    assert len(summary["applied"]) == 3
+    assert summary["written"] == ["pkg/app.py", "pkg/core.py", "pkg/util.py"]
+    spy.assert_called_once()
+
+    core = (tmp_path / "pkg" / "core.py").read_text()
+    app = (tmp_path / "pkg" / "app.py").read_text()
+    assert "def sum_doubled(items):" in core
+    assert "def accumulate(items, total):" in core
+    assert "LIMIT" not in core
+    assert "sum_doubled(range(pkg.util.LIMIT))" in app
+    assert (tmp_path / "pkg" / "util.py").read_text().strip() == "LIMIT = 10"
+
+
+def test_rope_batch_is_undone_when_one_refactoring_fails(tmp_path):
+    """
+    Tests that a failing refactoring leaves every file untouched, and that
+    the long-lived project still picks up edits made outside rope.
+    """
+    _make_project(tmp_path)
+    original_app = (tmp_path / "pkg" / "app.py").read_text()
+
+    result = rope_refactor(
+        str(tmp_path),
+        [
+            {"op": "rename", "path": "pkg/app.py", "symbol": "main", "new_name": "run"},
+            {"op": "rename", "path": "pkg/app.py", "symbol": "nope", "new_name": "x"},
+        ],
+    )
+
+    assert result.startswith("Error:")
+    assert (tmp_path / "pkg" / "app.py").read_text() == original_app
+
+    (tmp_path / "pkg" / "app.py").write_text(original_app + "\n\nmain()\n")
+    result = refactoring_agent.rope_rename(str(tmp_path), "pkg/app.py", "main", "run")
+
+    assert not result.startswith("Error:")
+    assert (tmp_path / "pkg" / "app.py").read_text().endswith("\nrun()\n")
+
+
+def test_write_files_writes_every_file(tmp_path):
+    """
+    Tests that write_files creates missing directories and writes all files.
+    """
+    files = {
+        str(tmp_path / "a.py"): "a = 1\n",
+        str(tmp_path / "sub" / "b.py"): "b = 2\n",
+    }
+
+    result = write_files(files)
+
+    assert result == "Successfully wrote 2 files."
+    assert (tmp_path / "a.py").read_text() == "a = 1\n"
+    assert (tmp_path / "sub" / "b.py").read_text() == "b = 2\n"
+    assert not list(tmp_path.rglob("*.aegis-tmp"))
+    umask = os.umask(0)
+    os.umask(umask)
+    assert (tmp_path / "a.py").stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_write_files_restores_every_file_when_one_move_fails(tmp_path, mocker):
+    """
+    Tests that when moving a staged file into place fails, the files already
+    replaced get their old content back and new files and directories are
+    removed.
+    """
+    (tmp_path / "a.py").write_text("a = 0\n")
+    files = {
+        str(tmp_path / "a.py"): "a = 1\n",
+        str(tmp_path / "new" / "pkg" / "new.py"): "new = 1\n",
+        str(tmp_path / "c.py"): "c = 1\n",
+    }
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if str(dst).endswith("c.py"):
+            raise OSError("disk full")
+        return real_replace(src, dst)
+
+    mocker.patch.object(refactoring_agent.os, "replace", side_effect=failing_replace)
+
+    result = write_files(files)
+
+    assert result.startswith("Error:")
+    assert (tmp_path / "a.py").read_text() == "a = 0\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.py"]
+
+
+def test_rope_batch_is_undone_when_writing_fails(tmp_path, mocker):
+    """
+    Tests that a failed write also rolls back what rope already did on disk,
+    such as renaming a module, so a retry starts from the original tree.
+    """
+    _make_project(tmp_path)
+    mocker.patch.object(
+        refactoring_agent, "write_files", return_value="Error: disk full"
+    )
+    rename_module = [{"op": "rename", "path": "pkg/core.py", "new_name": "calc"}]
+
+    assert rope_refactor(str(tmp_path), rename_module).startswith("Error:")
+    assert (tmp_path / "pkg" / "core.py").exists()
+    assert not (tmp_path / "pkg" / "calc.py").exists()
+
+    mocker.stopall()
+    assert not rope_refactor(str(tmp_path), rename_module).startswith("Error:")
+    assert (tmp_path / "pkg" / "calc.py").exists()
+    assert "from pkg.calc import" in (tmp_path / "pkg" / "app.py").read_text()
+
+
+def test_rope_rejects_a_missing_repository_root(tmp_path):
+    """
+    Tests that a repository root that does not exist is reported as an error
+    instead of being created.
+    """
+    missing = tmp_path / "does-not-exist"
+
+    result = rope_refactor(
+        str(missing), [{"op": "rename", "path": "a.py", "new_name": "b"}]
+    )
+
+    assert result.startswith("Error:")
+    assert "is not a directory" in result
+    assert not missing.exists()
@@ -0,0 +1,86 @@
+# In src/tests/test_security_agent.py
+
+from src.agents import security_agent
+from src.agents.security_agent import scan_changed_files
+from src.cache.shared_cache import SharedCache
+
+RISKY_CODE = (
+    "import subprocess\n"
+    "\n"
+    "\n"
+    "def run(cmd):\n"
+    "    subprocess.call(cmd, shell=True)\n"
+    "    return eval(cmd)\n"
+)
+
+
+def _diff_adding_line(path: str, line: int) -> str:
+    return f"--- a/{path}\n+++ b/{path}\n" f"@@ -{line},0 +{line},1 @@\n+changed\n"
+
+
+def test_scan_reports_only_findings_on_changed_lines(tmp_path):
+    """
+    Tests that bandit findings are filtered to the lines added by the diff,
+    across several files scanned in parallel processes, and that later scans
+    reuse the same worker pool.
+    """
+    names = ["a.py", "b.py", "c.py", "d.py"]
+    for name in names:
+        (tmp_path / name).write_text(RISKY_CODE)
+    (tmp_path / "notes.txt").write_text("eval(x)\n")
+    diff = "".join(_diff_adding_line(name, 5) for name in names[:2])
+    diff += "".join(_diff_adding_line(name, 6) for name in names[2:])
+    diff += _diff_adding_line("notes.txt", 1)
+
+    findings = scan_changed_files(diff, repo_root=str(tmp_path), max_workers=2)
+    pool = security_agent._scan_pool
+    scan_changed_files(diff, repo_root=str(tmp_path), max_workers=2)
+
+    assert [(f["file"], f["line"]) for f in findings] == [
+        ("a.py", 5),
+        ("b.py", 5),
+        ("c.py", 6),
+        ("d.py", 6),
+    ]
+    assert [f["test_id"] for f in findings] == ["B602", "B602", "B307", "B307"]
+    assert pool is not None
+    assert security_agent._scan_pool is pool
+
+
+def test_scan_reuses_cached_results_for_unchanged_content(tmp_path, mocker):
+    """
+    Tests that a file whose content hash is already cached is not rescanned,
+    unless the installed bandit version has changed.
+    """
+    (tmp_path / "a.py").write_text(RISKY_CODE)
+    cache = SharedCache(str(tmp_path / "shared.sqlite3"))
+    diff = _diff_adding_line("a.py", 5)
+
+    first = scan_changed_files(diff, str(tmp_path), cache=cache, max_workers=1)
+    spy = mocker.patch.object(security_agent, "scan_source", return_value=[])
+    second = scan_changed_files(diff, str(tmp_path), cache=cache, max_workers=1)
+
+    assert second == first
+    spy.assert_not_called()
+
+    # Results from another bandit release are not reused.
+    mocker.patch.object(security_agent, "_bandit_version", "0.0.0")
+    scan_changed_files(diff, str(tmp_path), cache=cache, max_workers=1)
+    spy.assert_called_once()
+
+
+def test_pr_review_merges_security_findings(tmp_path, monkeypatch):
+    """
+    Tests that the PR review workflow returns the security findings and
+    appends them to the review comment.
+    """
+    from src.teams.pr_review_team import run_pr_review
+
+    monkeypatch.setenv("AEGIS_CACHE_PATH", str(tmp_path / "shared.sqlite3"))
+    (tmp_path / "a.py").write_text(RISKY_CODE)
+
+    result = run_pr_review(_diff_adding_line("a.py", 5), repo_root=str(tmp_path))
+
+    assert [f["test_id"] for f in result["findings"]] == ["B602"]
+    assert "### Security scan" in result["review"]
+    assert "`a.py:5`" in result["review"]
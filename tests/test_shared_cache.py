@@ -0,0 +1,79 @@
+# In src/tests/test_shared_cache.py
+
+import multiprocessing
+import time
+
+from src.cache.shared_cache import JOB_RETENTION_SECONDS, JobStore, SharedCache
+
+
+def _write_from_other_process(path: str) -> None:
+    SharedCache(path).set("analysis", "abc", {"classes": ["FromWorker"]})
+    jobs = JobStore(path)
+    job_id = jobs.create_job("review_pr")
+    jobs.update_job(job_id, "completed", result={"review": "done"})
+
+
+def test_cache_and_jobs_are_shared_across_processes(tmp_path):
+    """
+    Tests that values and job updates written by one process are visible
+    to another process using the same database file.
+    """
+    path = str(tmp_path / "shared.sqlite3")
+    cache = SharedCache(path)
+    jobs = JobStore(path)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=_write_from_other_process, args=(path,)
+    )
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert cache.get("analysis", "abc") == {"classes": ["FromWorker"]}
+    [job] = jobs.list_jobs()
+    assert job["status"] == "completed"
+    assert job["result"] == {"review": "done"}
+    assert jobs.get_job(job["job_id"]) == job
+
+
+def test_cache_expiry_and_get_or_compute(tmp_path):
+    """
+    Tests that get_or_compute only computes on a miss and that expired
+    entries are treated as missing.
+    """
+    cache = SharedCache(str(tmp_path / "shared.sqlite3"))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [1, 2, 3]
+
+    assert cache.get_or_compute("ns", "key", compute) == [1, 2, 3]
+    assert cache.get_or_compute("ns", "key", compute) == [1, 2, 3]
+    assert len(calls) == 1
+
+    cache.set("ns", "stale", "value", ttl=-1)
+    assert cache.get("ns", "stale") is None
+
+
+def test_prune_removes_expired_entries_and_old_finished_jobs(tmp_path):
+    """
+    Tests that pruning drops expired cache rows and finished jobs past the
+    retention period, but keeps live entries and unfinished jobs.
+    """
+    path = str(tmp_path / "shared.sqlite3")
+    cache = SharedCache(path)
+    jobs = JobStore(path)
+    cache.set("ns", "stale", "value", ttl=-1)
+    cache.set("ns", "fresh", "value")
+    done = jobs.create_job("review_pr")
+    jobs.update_job(done, "completed", result={})
+    running = jobs.create_job("review_pr")
+    jobs.update_job(running, "running")
+
+    jobs.prune(now=time.time() + JOB_RETENTION_SECONDS + 1)
+
+    rows = cache._connect().execute("SELECT key FROM cache").fetchall()
+    assert [row["key"] for row in rows] == ["fresh"]
+    assert jobs.get_job(done) is None
+    assert jobs.get_job(running)["status"] == "running"